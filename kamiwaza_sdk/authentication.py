@@ -5,8 +5,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-import time
-from typing import Optional
+from typing import Callable, Optional
 
 import requests
 
@@ -18,6 +17,10 @@ LOGGER = logging.getLogger(__name__)
 _REFRESH_LEEWAY = timedelta(seconds=30)
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Authenticator(ABC):
     """Interface for client authentication strategies."""
 
@@ -67,7 +70,11 @@ class ApiKeyAuthenticator(Authenticator):
 
 
 class UserPasswordAuthenticator(Authenticator):
-    """Authenticator that performs password grant and manages refresh tokens."""
+    """Authenticator that performs password grant and manages refresh tokens.
+
+    ``clock`` optionally overrides the timezone-aware "now" used for token
+    expiry, refresh and cached-token checks (defaults to UTC wall time).
+    """
 
     def __init__(
         self,
@@ -76,10 +83,14 @@ class UserPasswordAuthenticator(Authenticator):
         auth_service,
         *,
         token_store: Optional[TokenStore] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         self.username = username
         self.password = password
         self.auth_service = auth_service
+        # Timezone-aware "now"; injectable so expiry/refresh can be tested
+        # without touching the system clock.
+        self._clock = clock or _utc_now
         self.token: Optional[str] = None
         self.token_expiry: Optional[datetime] = None
         self.refresh_token_value: Optional[str] = None
@@ -87,7 +98,7 @@ class UserPasswordAuthenticator(Authenticator):
         self._load_cached_token()
 
     def authenticate(self, session: requests.Session) -> None:
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         if (
             not self.token
             or self.token_expiry is None
@@ -130,7 +141,7 @@ class UserPasswordAuthenticator(Authenticator):
         session.headers.update({"Authorization": f"Bearer {self.token}"})
 
     def get_access_token(self, session: requests.Session) -> Optional[str]:
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         if (
             not self.token
             or self.token_expiry is None
@@ -141,8 +152,8 @@ class UserPasswordAuthenticator(Authenticator):
 
     def _store_token_response(self, token_response: TokenResponse) -> None:
         self.token = token_response.access_token
-        expiry_epoch = time.time() + token_response.expires_in
-        self.token_expiry = datetime.fromtimestamp(expiry_epoch, tz=timezone.utc)
+        self.token_expiry = self._clock() + timedelta(seconds=token_response.expires_in)
+        expiry_epoch = self.token_expiry.timestamp()
         if token_response.refresh_token:
             self.refresh_token_value = token_response.refresh_token
         stored = StoredToken(
@@ -159,7 +170,7 @@ class UserPasswordAuthenticator(Authenticator):
         cached = self.token_store.load()
         if not cached:
             return
-        if cached.is_expired:
+        if cached.is_expired(now=self._clock().timestamp()):
             self.token_store.clear()
             return
         self.token = cached.access_token
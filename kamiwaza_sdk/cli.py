@@ -121,7 +121,7 @@ def pat_create_command(
 ) -> str:
     store = token_store or FileTokenStore(args.token_path)
     cached = store.load()
-    if not cached or cached.is_expired:
+    if not cached or cached.is_expired():
         raise AuthenticationError("Login first with `kamiwaza login` to cache a session token.")
 
     client = client_factory(args.base_url, api_key=cached.access_token)
@@ -148,7 +148,7 @@ def serve_deploy_command(
 ) -> dict[str, str]:
     store = token_store or FileTokenStore(args.token_path)
     cached = store.load()
-    if not cached or cached.is_expired:
+    if not cached or cached.is_expired():
         raise AuthenticationError("Login first with `kamiwaza login` to cache a session token.")
 
     client = client_factory(args.base_url, api_key=cached.access_token)
@@ -1,12 +1,15 @@
 # kamiwaza_sdk/services/openai.py    
 
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
-import httpx
-from openai import OpenAI
 from .base_service import BaseService
 from ..exceptions import APIError, AuthenticationError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from openai import OpenAI
+
 class OpenAIService(BaseService):
     def get_client(
         self,
@@ -75,6 +78,11 @@ class OpenAIService(BaseService):
                 "Unable to configure OpenAI client without an authenticated session or API key."
             )
 
+        # openai is imported here rather than at module load: it takes longer
+        # to import than the rest of the SDK, and only this method needs it.
+        import httpx
+        from openai import OpenAI
+
         # Create httpx client with same verify setting as Kamiwaza client
         http_client = httpx.Client(verify=self.client.session.verify)
         
@@ -18,9 +18,9 @@ class StoredToken:
     refresh_token: Optional[str]
     expires_at: float  # epoch seconds
 
-    @property
-    def is_expired(self) -> bool:
-        return self.expires_at <= time.time()
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Whether the token has expired at ``now`` (epoch seconds, default: wall clock)."""
+        return self.expires_at <= (time.time() if now is None else now)
 
 
 class TokenStore:
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import getpass
 import os
-import sys
 from pathlib import Path
 from typing import Any, Callable, Dict, Tuple
 
 import pytest
 
+from kamiwaza_sdk.token_store import StoredToken, TokenStore
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
 def _load_env_file(env_file: Path) -> None:
     if not env_file.exists():
@@ -85,6 +85,27 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             "(defaults to env KAMIWAZA_PASSWORD, else integration fixture resolves via kz-login)."
         ),
     )
+    group.addoption(
+        "--tmp-root",
+        action="store",
+        default=os.environ.get("KAMIWAZA_TEST_TMP_ROOT", ""),
+        help=(
+            "Directory (e.g. a tmpfs such as /dev/shm) under which pytest's basetemp is "
+            "placed, so tmp_path fixtures stay off disk. Ignored when --basetemp is given "
+            "or the directory does not exist (defaults to env KAMIWAZA_TEST_TMP_ROOT)."
+        ),
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    tmp_root = config.getoption("--tmp-root")
+    # xdist workers inherit a per-worker basetemp from the controller.
+    if not tmp_root or config.option.basetemp or hasattr(config, "workerinput"):
+        return
+    root = Path(tmp_root).expanduser()
+    if root.is_dir():
+        # pytest clears basetemp on startup, so keep it in a dedicated per-user dir.
+        config.option.basetemp = str(root / f"kamiwaza-tests-{getpass.getuser()}")
 
 
 @pytest.fixture(scope="session")
@@ -116,6 +137,10 @@ def hf_cache_dir() -> Path:
     return path
 
 
+# Canned responses may legitimately be None, so misses need their own marker.
+_MISSING = object()
+
+
 class DummyAPIClient:
     """Minimal HTTP client stub that records calls and replays canned responses."""
 
@@ -125,11 +150,11 @@ class DummyAPIClient:
 
     def _dispatch(self, method: str, path: str, **kwargs) -> Any:
         self.calls.append((method, path, kwargs))
-        key = (method, path)
-        if key not in self.responses:
+        response = self.responses.get((method, path), _MISSING)
+        if response is _MISSING:
             available = ", ".join(f"{m} {p}" for m, p in self.responses)
             raise AssertionError(f"Unexpected request {method} {path}. Known: {available}")
-        return self.responses[key]
+        return response
 
     def get(self, path: str, **kwargs) -> Any:
         return self._dispatch("get", path, **kwargs)
@@ -157,6 +182,29 @@ def dummy_client() -> Callable[[Dict[Tuple[str, str], Any]], DummyAPIClient]:
     return _factory
 
 
+class MemoryTokenStore(TokenStore):
+    """``TokenStore`` that keeps the token on the instance instead of on disk."""
+
+    def __init__(self):
+        self.value: StoredToken | None = None
+
+    def load(self):
+        return self.value
+
+    def save(self, token: StoredToken):
+        self.value = token
+
+    def clear(self):
+        self.value = None
+
+
+@pytest.fixture
+def memory_token_store() -> MemoryTokenStore:
+    """In-memory ``TokenStore`` so auth/CLI unit tests never touch the token file."""
+
+    return MemoryTokenStore()
+
+
 @pytest.fixture(scope="session")
 def live_base_url(pytestconfig: pytest.Config) -> str:
     return str(pytestconfig.getoption("live_base_url")).rstrip("/")
@@ -196,3 +244,18 @@ def client_factory():
         )
 
     return _factory
+
+
+@pytest.fixture(scope="session")
+def env_client():
+    """Client built once from ``KAMIWAZA_BASE_URL`` for service-wiring checks.
+
+    The env var is only set while the client is constructed, so it does not
+    leak into tests that exercise env resolution themselves.
+    """
+
+    from kamiwaza_sdk import KamiwazaClient
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("KAMIWAZA_BASE_URL", "https://example.test/api")
+        return KamiwazaClient()
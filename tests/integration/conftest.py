@@ -100,6 +100,20 @@ def _mount_probe_timeout(client: KamiwazaClient) -> None:
     adapter = _TimeoutHTTPAdapter(timeout=_PROBE_TIMEOUT_SECONDS)
     client.session.mount("http://", adapter)
     client.session.mount("https://", adapter)
+
+
+# Live clients are rebuilt per test, and each fresh ``requests.Session`` would
+# otherwise open (and TLS-handshake) its own connections. Mounting one shared
+# adapter lets every live client draw from the same keep-alive pool.
+_LIVE_POOL_MAXSIZE = 32
+
+
+def _mount_live_adapter(client: KamiwazaClient, adapter: HTTPAdapter) -> KamiwazaClient:
+    client.session.mount("http://", adapter)
+    client.session.mount("https://", adapter)
+    return client
+
+
 _HTTP_TRACE_FLAG = "KAMIWAZA_HTTP_TRACE"
 _HTTP_TRACE_FILE_ENV = "KAMIWAZA_HTTP_TRACE_FILE"
 _TEXT_BODY_MARKERS = (
@@ -1045,24 +1059,53 @@ def qwen_snapshot_dir(hf_cache_dir: Path) -> Path:
     return Path(snapshot_path)
 
 
+@pytest.fixture(scope="session")
+def live_http_adapter() -> Iterator[HTTPAdapter]:
+    """Session-wide connection pool shared by every live client."""
+    adapter = HTTPAdapter(
+        pool_connections=_LIVE_POOL_MAXSIZE, pool_maxsize=_LIVE_POOL_MAXSIZE
+    )
+    try:
+        yield adapter
+    finally:
+        adapter.close()
+
+
+@pytest.fixture(scope="session")
+def mount_live_adapter(
+    live_http_adapter: HTTPAdapter,
+) -> Callable[[KamiwazaClient], KamiwazaClient]:
+    """Attach the shared live connection pool to a client built in a test module."""
+
+    def _mount(client: KamiwazaClient) -> KamiwazaClient:
+        return _mount_live_adapter(client, live_http_adapter)
+
+    return _mount
+
+
 @pytest.fixture
 def live_kamiwaza_client(
     live_server_available: str,
     live_session_api_key: str,
     resolved_live_password: str,
     live_username: str,
+    live_http_adapter: HTTPAdapter,
 ) -> KamiwazaClient:
     """Provide an authenticated client for integration tests."""
     os.environ.setdefault("KAMIWAZA_VERIFY_SSL", "false")
 
     api_key = live_session_api_key.strip()
     if api_key:
-        return KamiwazaClient(live_server_available, api_key=api_key)
+        return _mount_live_adapter(
+            KamiwazaClient(live_server_available, api_key=api_key), live_http_adapter
+        )
 
     username = live_username.strip()
     password = resolved_live_password.strip()
     if username and password:
-        client = KamiwazaClient(live_server_available)
+        client = _mount_live_adapter(
+            KamiwazaClient(live_server_available), live_http_adapter
+        )
         client.authenticator = UserPasswordAuthenticator(
             username, password, client._auth_service, token_store=_NoCacheTokenStore()
         )
@@ -1080,18 +1123,23 @@ def live_kamiwaza_session_client(
     live_session_api_key: str,
     resolved_live_password: str,
     live_username: str,
+    live_http_adapter: HTTPAdapter,
 ) -> KamiwazaClient:
     """Session-scoped authenticated client for shared live prerequisites."""
     os.environ.setdefault("KAMIWAZA_VERIFY_SSL", "false")
 
     api_key = live_session_api_key.strip()
     if api_key:
-        return KamiwazaClient(live_server_available, api_key=api_key)
+        return _mount_live_adapter(
+            KamiwazaClient(live_server_available, api_key=api_key), live_http_adapter
+        )
 
     username = live_username.strip()
     password = resolved_live_password.strip()
     if username and password:
-        client = KamiwazaClient(live_server_available)
+        client = _mount_live_adapter(
+            KamiwazaClient(live_server_available), live_http_adapter
+        )
         client.authenticator = UserPasswordAuthenticator(
             username, password, client._auth_service, token_store=_NoCacheTokenStore()
         )
@@ -1567,6 +1615,7 @@ def live_session_write_key(
 def live_write_client(
     live_server_available: str,
     live_session_write_key: str,
+    live_http_adapter: HTTPAdapter,
 ) -> KamiwazaClient:
     """Client authenticated at write scope (no admin role).
 
@@ -1579,7 +1628,9 @@ def live_write_client(
     if not api_key:
         pytest.skip("Write-scoped session PAT unavailable")
 
-    return KamiwazaClient(live_server_available, api_key=api_key)
+    return _mount_live_adapter(
+        KamiwazaClient(live_server_available, api_key=api_key), live_http_adapter
+    )
 
 
 @pytest.fixture(scope="session")
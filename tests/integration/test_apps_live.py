@@ -49,7 +49,7 @@ def test_apps_template_crud_and_images(live_kamiwaza_client) -> None:
         assert template_id
 
         templates = client.get("/apps/app_templates")
-        assert any(str(item.get("id")) == template_id for item in templates)
+        assert template_id in {str(item.get("id")) for item in templates}
 
         fetched = client.get(f"/apps/app_templates/{template_id}")
         assert fetched.get("id") == template_id
@@ -60,7 +60,7 @@ def test_catalog_dataset_and_secret_lifecycle(live_kamiwaza_client):
         delay = 2
         for i in range(attempts):
             secrets = client.catalog.list_secrets(query=secret_name)
-            if any(item.urn == secret_urn for item in secrets):
+            if secret_urn in {item.urn for item in secrets}:
                 break
             if i < attempts - 1:
                 time.sleep(delay)
@@ -38,9 +38,8 @@ class TestClusterReadOperations:
         clusters = live_kamiwaza_client.cluster.list_clusters()
         assert isinstance(clusters, list)
         # Clusters may be empty but should return a list
-        for cluster in clusters:
-            assert hasattr(cluster, "id")
-            assert hasattr(cluster, "name")
+        if clusters:
+            assert {"id", "name"} <= type(clusters[0]).model_fields.keys()
 
     def test_get_hostname(self, live_kamiwaza_client) -> None:
         """TS4.018: GET /cluster/get_hostname - Get cluster hostname."""
@@ -64,8 +63,8 @@ class TestClusterReadOperations:
             hardware_list = live_kamiwaza_client.cluster.list_hardware()
             assert isinstance(hardware_list, list)
             # Hardware may be empty but should return a list
-            for hw in hardware_list:
-                assert hasattr(hw, "id")
+            if hardware_list:
+                assert "id" in type(hardware_list[0]).model_fields
         except APIError as exc:
             if exc.status_code == 500:
                 pytest.skip(f"Hardware list endpoint returned 500: {exc}")
@@ -76,9 +75,8 @@ class TestClusterReadOperations:
         locations = live_kamiwaza_client.cluster.list_locations()
         assert isinstance(locations, list)
         # Locations may be empty but should return a list
-        for loc in locations:
-            assert hasattr(loc, "id")
-            assert hasattr(loc, "name")
+        if locations:
+            assert {"id", "name"} <= type(locations[0]).model_fields.keys()
 
     def test_list_nodes(self, live_kamiwaza_client) -> None:
         """TS4.028: GET /cluster/nodes - List all nodes."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -26,10 +27,23 @@ DEFAULT_WORKROOM_ID = os.getenv(
     ContextService.DEFAULT_WORKROOM_ID,
 )
 TEST_VECTOR = [round(index * 0.01, 4) for index in range(1, 33)]
+# Rows per insert request; exercises the batched insert path in one round trip.
+TEST_BATCH_SIZE = 16
+# Built once at import; the service only serializes the rows, never mutates them.
+TEST_VECTORS = [
+    [round((row + index) * 0.01, 4) for index in range(1, len(TEST_VECTOR) + 1)]
+    for row in range(TEST_BATCH_SIZE)
+]
+TEST_QUERY_VECTORS = [TEST_VECTOR]
+TEST_METADATA = [{"source": "sdk-context-live"} for _ in range(TEST_BATCH_SIZE)]
+
+
+def _sample_vectors(count: int = TEST_BATCH_SIZE) -> list[list[float]]:
+    return TEST_VECTORS[:count]
 
 
-def _sample_vector() -> list[float]:
-    return list(TEST_VECTOR)
+def _sample_metadata(count: int = TEST_BATCH_SIZE) -> list[dict[str, str]]:
+    return TEST_METADATA[:count]
 
 
 def _sdk_collection_name() -> str:
@@ -208,6 +222,7 @@ def shared_context_service(
     live_session_api_key: str,
     resolved_live_password: str,
     live_username: str,
+    mount_live_adapter,
 ) -> ContextService:
     """Session-scoped context service client for shared provisioning fixtures."""
     os.environ.setdefault("KAMIWAZA_VERIFY_SSL", "false")
@@ -230,6 +245,8 @@ def shared_context_service(
             client._auth_service,
         )
 
+    mount_live_adapter(client)
+
     service = client.context
     assert isinstance(service, ContextService)
     return service
@@ -317,6 +334,16 @@ def shared_workroom_vectordb(shared_context_service: ContextService) -> str:
         )
 
 
+@pytest.fixture(scope="module")
+def shared_collection_name() -> str:
+    """One collection in ``shared_vectordb`` reused by the vector tests.
+
+    Created on first insert via ``create_if_missing``; every test writes rows
+    of the same dimension and metadata shape, so sharing it is safe.
+    """
+    return _sdk_collection_name()
+
+
 @pytest.fixture(scope="session")
 def shared_ontology(
     shared_context_service: ContextService,
@@ -370,58 +397,94 @@ def test_context_vectordb_lifecycle_global(live_kamiwaza_client) -> None:
         _safe_delete_vectordb(service, vectordb_id)
 
 
+@pytest.mark.parametrize("batch_size", [1, TEST_BATCH_SIZE])
 def test_context_vectordb_insert_vectors_instance(
     live_kamiwaza_client,
     shared_vectordb: str,
+    shared_collection_name: str,
+    batch_size: int,
 ) -> None:
     service = _context_service(live_kamiwaza_client)
     vectordb_id = shared_vectordb
-    collection_name = _sdk_collection_name()
+    collection_name = shared_collection_name
 
     inserted = service.insert_vectors(
         vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
-        metadata=[{"source": "sdk-context-live"}],
+        vectors=_sample_vectors(batch_size),
+        metadata=_sample_metadata(batch_size),
     )
-    assert inserted["inserted_count"] == 1
+    assert inserted["inserted_count"] == batch_size
 
 
+@pytest.mark.parametrize("batch_size", [1, TEST_BATCH_SIZE])
 def test_context_vectordb_insert_vectors_global(
     live_kamiwaza_client,
     shared_vectordb: str,
+    shared_collection_name: str,
+    batch_size: int,
 ) -> None:
     service = _context_service(live_kamiwaza_client)
     vectordb_id = shared_vectordb
-    collection_name = _sdk_collection_name()
+    collection_name = shared_collection_name
 
     inserted = service.insert_vectors_global(
         vectordb_id=vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
-        metadata=[{"source": "sdk-context-live"}],
+        vectors=_sample_vectors(batch_size),
+        metadata=_sample_metadata(batch_size),
     )
-    assert inserted["inserted_count"] == 1
+    assert inserted["inserted_count"] == batch_size
+
+
+def test_context_vectordb_insert_vectors_concurrent(
+    live_kamiwaza_client,
+    shared_vectordb: str,
+    shared_collection_name: str,
+) -> None:
+    """Concurrent chunked inserts into one collection all land."""
+    service = _context_service(live_kamiwaza_client)
+    chunk_size = TEST_BATCH_SIZE // 4
+    chunks = [
+        TEST_VECTORS[start : start + chunk_size]
+        for start in range(0, TEST_BATCH_SIZE, chunk_size)
+    ]
+
+    def insert(vectors: list[list[float]]) -> dict:
+        return service.insert_vectors(
+            shared_vectordb,
+            collection_name=shared_collection_name,
+            vectors=vectors,
+            metadata=_sample_metadata(len(vectors)),
+        )
+
+    # The first insert may create the collection; don't race that.
+    results = [insert(chunks[0])]
+    with ThreadPoolExecutor(max_workers=len(chunks) - 1) as executor:
+        results.extend(executor.map(insert, chunks[1:]))
+
+    assert sum(result["inserted_count"] for result in results) == TEST_BATCH_SIZE
 
 
 def test_context_vectordb_query_vectors_instance(
     live_kamiwaza_client,
     shared_vectordb: str,
+    shared_collection_name: str,
 ) -> None:
     service = _context_service(live_kamiwaza_client)
     vectordb_id = shared_vectordb
-    collection_name = _sdk_collection_name()
+    collection_name = shared_collection_name
 
     service.insert_vectors(
         vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
-        metadata=[{"source": "sdk-context-live"}],
+        vectors=_sample_vectors(1),
+        metadata=_sample_metadata(1),
     )
     queried = service.query_vectors(
         vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
+        vectors=TEST_QUERY_VECTORS,
         limit=1,
     )
     assert isinstance(queried["results"], list)
@@ -430,21 +493,22 @@ def test_context_vectordb_query_vectors_instance(
 def test_context_vectordb_query_vectors_global(
     live_kamiwaza_client,
     shared_vectordb: str,
+    shared_collection_name: str,
 ) -> None:
     service = _context_service(live_kamiwaza_client)
     vectordb_id = shared_vectordb
-    collection_name = _sdk_collection_name()
+    collection_name = shared_collection_name
 
     service.insert_vectors_global(
         vectordb_id=vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
-        metadata=[{"source": "sdk-context-live"}],
+        vectors=_sample_vectors(1),
+        metadata=_sample_metadata(1),
     )
     queried = service.query_vectors_global(
         vectordb_id=vectordb_id,
         collection_name=collection_name,
-        vectors=[_sample_vector()],
+        vectors=TEST_QUERY_VECTORS,
         limit=1,
     )
     assert isinstance(queried["results"], list)
@@ -115,35 +115,43 @@ def test_list_extensions_raw(live_kamiwaza_client) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_get_nonexistent_extension_typed(live_kamiwaza_client) -> None:
-    """ExtensionService.get_extension() raises NotFoundError for bogus name."""
-    if not _k8s_available(live_kamiwaza_client):
-        pytest.skip("K8s extension API unavailable (503)")
-
-    bogus = f"sdk-test-does-not-exist-{uuid4().hex[:8]}"
-    with pytest.raises(NotFoundError):
-        live_kamiwaza_client.extensions.get_extension(bogus)
-
-
-def test_get_nonexistent_extension_raw(live_kamiwaza_client) -> None:
-    """GET /extensions/{bogus} returns 404."""
-    if not _k8s_available(live_kamiwaza_client):
-        pytest.skip("K8s extension API unavailable (503)")
-
-    bogus = f"sdk-test-does-not-exist-{uuid4().hex[:8]}"
-    with pytest.raises(APIError) as exc:
-        live_kamiwaza_client.get(f"/extensions/{bogus}")
-    assert exc.value.status_code in (404, 500)
-
-
-def test_delete_nonexistent_extension_typed(live_kamiwaza_client) -> None:
-    """ExtensionService.delete_extension() raises NotFoundError for bogus name."""
+_BOGUS_EXTENSION = f"sdk-test-does-not-exist-{uuid4().hex[:8]}"
+
+
+@pytest.mark.parametrize(
+    ("operation", "expected_exc", "statuses"),
+    [
+        pytest.param(
+            lambda client: client.extensions.get_extension(_BOGUS_EXTENSION),
+            NotFoundError,
+            None,
+            id="get-typed",
+        ),
+        pytest.param(
+            lambda client: client.get(f"/extensions/{_BOGUS_EXTENSION}"),
+            APIError,
+            (404, 500),
+            id="get-raw",
+        ),
+        pytest.param(
+            lambda client: client.extensions.delete_extension(_BOGUS_EXTENSION),
+            NotFoundError,
+            None,
+            id="delete-typed",
+        ),
+    ],
+)
+def test_nonexistent_extension_errors(
+    live_kamiwaza_client, operation, expected_exc, statuses
+) -> None:
+    """Typed service calls raise NotFoundError; raw GET /extensions/{bogus} 404s."""
     if not _k8s_available(live_kamiwaza_client):
         pytest.skip("K8s extension API unavailable (503)")
 
-    bogus = f"sdk-test-does-not-exist-{uuid4().hex[:8]}"
-    with pytest.raises(NotFoundError):
-        live_kamiwaza_client.extensions.delete_extension(bogus)
+    with pytest.raises(expected_exc) as exc:
+        operation(live_kamiwaza_client)
+    if statuses is not None:
+        assert exc.value.status_code in statuses
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +21,9 @@ from kamiwaza_sdk.schemas.retrieval import RetrievalJobStatus
 
 pytestmark = [pytest.mark.integration, pytest.mark.live, pytest.mark.withoutresponses]
 
+# Any UUID works for the "missing job" checks; one per module is enough.
+_FAKE_ID = uuid4()
+
 
 def _ingest_sample_dataset(client, ingestion_environment: dict[str, str]) -> str:
     bucket = ingestion_environment["bucket"]
@@ -79,7 +82,7 @@ class TestRetrievalJobStatus:
         Verifies that requesting status for a non-existent job returns
         an appropriate error response.
         """
-        fake_job_id = str(uuid4())
+        fake_job_id = str(_FAKE_ID)
 
         with pytest.raises((DatasetNotFoundError, APIError)):
             live_kamiwaza_client.retrieval.get_job(fake_job_id)
@@ -89,7 +92,7 @@ class TestRetrievalJobStatus:
 
         Tests the endpoint directly to verify it exists and responds correctly.
         """
-        fake_job_id = str(uuid4())
+        fake_job_id = str(_FAKE_ID)
 
         try:
             response = live_kamiwaza_client.get(f"/retrieval/jobs/{fake_job_id}")
@@ -10,6 +10,8 @@ as they need to be accessible before login.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from kamiwaza_sdk.exceptions import APIError
@@ -17,60 +19,84 @@ from kamiwaza_sdk.exceptions import APIError
 pytestmark = [pytest.mark.integration, pytest.mark.live, pytest.mark.withoutresponses]
 
 
+@pytest.fixture(scope="module")
+def security_responses(live_kamiwaza_session_client) -> dict[str, object]:
+    """Fetch the two read-only security endpoints concurrently, once.
+
+    Each value is either the response or the ``APIError`` it raised, so the
+    tests below keep their per-endpoint skip/assert behaviour.
+    """
+    client = live_kamiwaza_session_client
+    calls = {
+        "config": lambda: client.get("/security/public/config"),
+        # This endpoint returns JavaScript, not JSON
+        "embed": lambda: client.get("/security/embed.js", expect_json=False),
+    }
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {name: executor.submit(call) for name, call in calls.items()}
+
+    results: dict[str, object] = {}
+    for name, future in futures.items():
+        exc = future.exception()
+        if exc is not None and not isinstance(exc, APIError):
+            raise exc
+        results[name] = exc if exc is not None else future.result()
+    return results
+
+
+def _result_or_skip(security_responses: dict[str, object], name: str, reason: str):
+    result = security_responses[name]
+    if isinstance(result, APIError):
+        if result.status_code == 404:
+            pytest.skip(reason)
+        raise result
+    return result
+
+
 class TestSecurityPublicConfig:
     """Tests for security public configuration endpoint."""
 
-    def test_get_public_config(self, live_kamiwaza_client) -> None:
+    def test_get_public_config(self, security_responses) -> None:
         """TS18.003: GET /security/public/config - Get security configuration.
 
         Returns configuration needed by the frontend to render:
         - Pre-login consent gate (if enabled)
         - Classification banners (if enabled)
         """
-        try:
-            response = live_kamiwaza_client.get("/security/public/config")
-            assert response is not None
-            assert isinstance(response, dict)
-            # SecurityConfigResponse schema includes:
-            # - consent_enabled: bool
-            # - consent_content: optional str
-            # - banner_enabled: bool
-            # - banner_text: optional str
-            # - banner_color: optional str
-            assert "consent_enabled" in response or "banner_enabled" in response
-        except APIError as exc:
-            if exc.status_code == 404:
-                pytest.skip("Security service not available")
-            raise
+        response = _result_or_skip(
+            security_responses, "config", "Security service not available"
+        )
+        assert response is not None
+        assert isinstance(response, dict)
+        # SecurityConfigResponse schema includes:
+        # - consent_enabled: bool
+        # - consent_content: optional str
+        # - banner_enabled: bool
+        # - banner_text: optional str
+        # - banner_color: optional str
+        assert "consent_enabled" in response or "banner_enabled" in response
 
 
 class TestSecurityEmbedScript:
     """Tests for security embed script endpoint."""
 
-    def test_get_embed_script(self, live_kamiwaza_client) -> None:
+    def test_get_embed_script(self, security_responses) -> None:
         """TS18.002: GET /security/embed.js - Get embeddable JavaScript bundle.
 
         Returns a self-contained JavaScript file that apps can include to
         automatically display classification banners and enforce consent acceptance.
         """
-        try:
-            # This endpoint returns JavaScript, not JSON
-            response = live_kamiwaza_client.get(
-                "/security/embed.js",
-                expect_json=False
-            )
-            assert response is not None
-            # Check response is successful
-            assert response.status_code == 200
-            # Check content type is JavaScript
-            content_type = response.headers.get("content-type", "")
-            assert "javascript" in content_type.lower()
-            # Check response has content
-            assert len(response.text) > 0
-        except APIError as exc:
-            if exc.status_code == 404:
-                pytest.skip("Security embed.js not available")
-            raise
+        response = _result_or_skip(
+            security_responses, "embed", "Security embed.js not available"
+        )
+        assert response is not None
+        # Check response is successful
+        assert response.status_code == 200
+        # Check content type is JavaScript
+        content_type = response.headers.get("content-type", "")
+        assert "javascript" in content_type.lower()
+        # Check response has content
+        assert len(response.text) > 0
 
 
 class TestSecurityConsentAccept:
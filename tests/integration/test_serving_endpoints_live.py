@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID, uuid4
 
 import pytest
@@ -10,16 +11,37 @@ from kamiwaza_sdk.schemas.serving.serving import CreateModelDeployment
 
 pytestmark = [pytest.mark.integration, pytest.mark.live, pytest.mark.withoutresponses]
 
+# Any UUID works for the "missing resource" checks; one per module is enough.
+_FAKE_ID = uuid4()
 
-def _first_deployment_id(client) -> UUID | None:
-    deployments = client.serving.list_deployments()
+# The VRAM estimate only needs a well-formed deployment request; build it once.
+_ESTIMATE_PAYLOAD = CreateModelDeployment(
+    m_id=uuid4(),
+    m_config_id=uuid4(),
+    min_copies=1,
+    starting_copies=1,
+).model_dump(mode="json")
+
+
+@pytest.fixture(scope="module")
+def deployments(live_kamiwaza_session_client):
+    """List deployments once per module; the tests here only read them."""
+    return live_kamiwaza_session_client.serving.list_deployments()
+
+
+@pytest.fixture(scope="module")
+def instances(live_kamiwaza_session_client):
+    """List model instances once per module; the tests here only read them."""
+    return live_kamiwaza_session_client.serving.list_model_instances()
+
+
+def _first_deployment_id(deployments) -> UUID | None:
     if not deployments:
         return None
     return deployments[0].id
 
 
-def _first_instance_id(client) -> UUID | None:
-    instances = client.serving.list_model_instances()
+def _first_instance_id(instances) -> UUID | None:
     if not instances:
         return None
     return instances[0].id
@@ -28,27 +50,27 @@ def _first_instance_id(client) -> UUID | None:
 def test_serving_status_and_health(live_kamiwaza_client) -> None:
     client = live_kamiwaza_client
 
-    status = client.get("/serving/status")
-    assert status.get("status") in {"running", "not running"}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status, health = executor.map(client.get, ("/serving/status", "/serving/health"))
 
-    health = client.get("/serving/health")
+    assert status.get("status") in {"running", "not running"}
     assert isinstance(health, list)
 
 
-def test_serving_deployments_and_instances(live_kamiwaza_client) -> None:
+def test_serving_deployments_and_instances(
+    live_kamiwaza_client, deployments, instances
+) -> None:
     client = live_kamiwaza_client
 
-    deployments = client.serving.list_deployments()
     assert isinstance(deployments, list)
-
-    instances = client.serving.list_model_instances()
     assert isinstance(instances, list)
 
-    if instances:
-        instance = client.serving.get_model_instance(instances[0].id)
-        assert instance.id == instances[0].id
+    instance_id = _first_instance_id(instances)
+    if instance_id is not None:
+        instance = client.serving.get_model_instance(instance_id)
+        assert instance.id == instance_id
     else:
-        fake_instance_id = uuid4()
+        fake_instance_id = _FAKE_ID
         with pytest.raises(APIError) as exc_info:
             client.get(f"/serving/model_instance/{fake_instance_id}")
         if exc_info.value.status_code == 500:
@@ -59,27 +81,35 @@ def test_serving_deployments_and_instances(live_kamiwaza_client) -> None:
         assert exc_info.value.status_code == 404
 
 
-def test_serving_deployment_status_and_log_patterns(live_kamiwaza_client) -> None:
+def test_serving_deployment_status_and_log_patterns(
+    live_kamiwaza_client, deployments
+) -> None:
     client = live_kamiwaza_client
-    deployment_id = _first_deployment_id(client)
+    deployment_id = _first_deployment_id(deployments)
+    target_id = deployment_id or _FAKE_ID
+
+    # Status and log patterns are independent reads; overlap them.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(
+            client.get, f"/serving/deployment/{target_id}/status"
+        )
+        patterns_future = executor.submit(
+            client.get, f"/serving/deployment/{target_id}/logs/patterns"
+        )
 
     if deployment_id is None:
-        fake_deployment_id = uuid4()
-        with pytest.raises(APIError) as exc_info:
-            client.get(f"/serving/deployment/{fake_deployment_id}/status")
-        assert exc_info.value.status_code == 404
-
-        with pytest.raises(APIError) as exc_info:
-            client.get(f"/serving/deployment/{fake_deployment_id}/logs/patterns")
-        assert exc_info.value.status_code == 404
+        for future in (status_future, patterns_future):
+            with pytest.raises(APIError) as exc_info:
+                future.result()
+            assert exc_info.value.status_code == 404
         return
 
-    status = client.get(f"/serving/deployment/{deployment_id}/status")
+    status = status_future.result()
     assert isinstance(status, str)
     assert status
 
     try:
-        patterns = client.get(f"/serving/deployment/{deployment_id}/logs/patterns")
+        patterns = patterns_future.result()
     except APIError as exc:
         if exc.status_code == 404:
             pytest.skip(
@@ -95,14 +125,7 @@ def test_serving_deployment_status_and_log_patterns(live_kamiwaza_client) -> Non
 def test_serving_estimate_model_vram(live_kamiwaza_client) -> None:
     client = live_kamiwaza_client
 
-    payload = CreateModelDeployment(
-        m_id=uuid4(),
-        m_config_id=uuid4(),
-        min_copies=1,
-        starting_copies=1,
-    ).model_dump(mode="json")
-
-    estimate = client.post("/serving/estimate_model_vram", json=payload)
+    estimate = client.post("/serving/estimate_model_vram", json=_ESTIMATE_PAYLOAD)
     assert isinstance(estimate, dict)
     assert "computed_vram_estimate" in estimate
     assert "estimation_source" in estimate
@@ -1,37 +1,54 @@
 from __future__ import annotations
 
-import uuid
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import pytest
 
 from kamiwaza_sdk.exceptions import APIError
 from kamiwaza_sdk.schemas.models.model import CreateModelConfig
 
-pytestmark = [pytest.mark.integration, pytest.mark.live, pytest.mark.withoutresponses]
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.live,
+    pytest.mark.withoutresponses,
+    # The strip-thinking cross-check reads results the deploy variants record in
+    # module state, and each worker would otherwise deploy both configs again.
+    pytest.mark.xdist_group("qwen-serving"),
+]
 
 TEST_REPO_ID = "mlx-community/Qwen3-4B-4bit"
 CONFIG_PREFIX = "sdk-m2"
 WAIT_TIMEOUT = 600
+PROMPT = [
+    {
+        "role": "user",
+        "content": "Think of 5 good names for a three-legged cat.",
+    }
+]
 
 
 def _sample_logs(client, deployment_id):
     try:
-        lines = []
-        for idx, line in enumerate(
-            client.serving.stream_deployment_logs(
-                deployment_id,
-                poll_interval=0,
-                max_empty_polls=2,
+        return list(
+            islice(
+                client.serving.stream_deployment_logs(
+                    deployment_id,
+                    poll_interval=0,
+                    max_empty_polls=2,
+                ),
+                5,
             )
-        ):
-            lines.append(line)
-            if idx >= 4:
-                break
-        return lines
+        )
     except APIError:
         return []
 
 
+def _has_think_block(text):
+    return "<think>" in text
+
+
 def _ensure_model_cached(client, model):
     hub = getattr(model, "hub", None) or "hf"
     payload = {"model": model.repo_modelId, "hub": hub}
@@ -41,9 +58,35 @@ def _ensure_model_cached(client, model):
         pytest.skip(f"Model download API unavailable: {exc}")
 
 
-@pytest.mark.requires_deployable_model
-def test_deploy_qwen_and_infer_with_strip_thinking(live_kamiwaza_client, ensure_repo_ready):
-    client = live_kamiwaza_client
+def _deploy(client, model_id, config_id):
+    return client.serving.deploy_model(
+        model_id=str(model_id),
+        m_config_id=config_id,
+        lb_port=0,
+        autoscaling=False,
+        min_copies=1,
+        starting_copies=1,
+    )
+
+
+def _stop_quietly(client, deployment_id):
+    try:
+        client.serving.stop_deployment(deployment_id=deployment_id, force=True)
+    except Exception:
+        pass
+
+
+def _delete_config_quietly(client, config_id):
+    try:
+        client.models.delete_model_config(config_id)
+    except Exception:
+        pass
+
+
+@pytest.fixture(scope="session")
+def qwen_model_and_default_config(live_kamiwaza_session_client, ensure_repo_ready):
+    """Resolve the test model and its default config once per session."""
+    client = live_kamiwaza_session_client
     model = ensure_repo_ready(client, TEST_REPO_ID)
 
     _ensure_model_cached(client, model)
@@ -51,89 +94,116 @@ def test_deploy_qwen_and_infer_with_strip_thinking(live_kamiwaza_client, ensure_
     configs = client.models.get_model_configs(model.id)
     if not configs:
         pytest.skip("No model configs available for test model")
-    default_config = next((c for c in configs if c.default), configs[0])
+    return model, next((c for c in configs if c.default), configs[0])
 
-    unique_name = f"{CONFIG_PREFIX}-strip-{uuid.uuid4().hex[:6]}"
-    strip_config = client.models.create_model_config(
+
+@pytest.fixture(scope="module")
+def strip_config(live_kamiwaza_session_client, qwen_model_and_default_config):
+    """Create the strip-thinking config once per module."""
+    client = live_kamiwaza_session_client
+    model, _ = qwen_model_and_default_config
+    config = client.models.create_model_config(
         CreateModelConfig(
             m_id=model.id,
-            name=unique_name,
+            name=f"{CONFIG_PREFIX}-strip-{secrets.token_hex(3)}",
             default=False,
             description="SDK integration test strip-thinking config",
             config={"strip_thinking": True},
             system_config={},
         )
     )
-
-    deployments = []
     try:
-        default_deployment = client.serving.deploy_model(
-            model_id=str(model.id),
-            m_config_id=default_config.id,
-            lb_port=0,
-            autoscaling=False,
-            min_copies=1,
-            starting_copies=1,
-        )
-        deployments.append(default_deployment)
-
-        strip_deployment = client.serving.deploy_model(
-            model_id=str(model.id),
-            m_config_id=strip_config.id,
-            lb_port=0,
-            autoscaling=False,
-            min_copies=1,
-            starting_copies=1,
-        )
-        deployments.append(strip_deployment)
+        yield config
+    finally:
+        _delete_config_quietly(client, config.id)
+
+
+@pytest.fixture(scope="module")
+def qwen_deployments(
+    live_kamiwaza_session_client,
+    qwen_model_and_default_config,
+    strip_config,
+    deployable_model_prerequisite,
+):
+    """Issue the default and strip deploys together, once per module.
+
+    Deploys are not waited on here so the two model loads overlap; each test
+    waits on its own. A failed deploy is stored instead of raised so the
+    other variant still runs.
+    """
+    client = live_kamiwaza_session_client
+    model, default_config = qwen_model_and_default_config
+    config_ids = {"default": default_config.id, "strip": strip_config.id}
+
+    with ThreadPoolExecutor(max_workers=len(config_ids)) as executor:
+        futures = {
+            kind: executor.submit(_deploy, client, model.id, config_id)
+            for kind, config_id in config_ids.items()
+        }
+    deployments = {
+        kind: future.exception() or future.result() for kind, future in futures.items()
+    }
+    try:
+        yield deployments
+    finally:
+        # Stop in parallel, but let every stop finish before strip_config's
+        # teardown deletes the config out from under a live deployment.
+        started = [
+            dep for dep in deployments.values() if not isinstance(dep, BaseException)
+        ]
+        with ThreadPoolExecutor(max_workers=len(started) or 1) as executor:
+            for dep in started:
+                executor.submit(_stop_quietly, client, dep)
 
-        default_details = client.serving.wait_for_deployment(
-            default_deployment,
-            poll_interval=5,
-            timeout=WAIT_TIMEOUT,
-        )
-        strip_details = client.serving.wait_for_deployment(
-            strip_deployment,
-            poll_interval=5,
-            timeout=WAIT_TIMEOUT,
-        )
 
-        assert default_details.instances, "Default deployment should report instances"
-        assert strip_details.instances, "Strip deployment should report instances"
+@pytest.fixture(scope="module")
+def think_block_seen():
+    """Per-config ``<think>`` presence recorded by the inference tests.
 
-        _sample_logs(client, default_deployment)
-        _sample_logs(client, strip_deployment)
+    A variant stores ``None`` when it starts and its result once inference
+    succeeds, so the cross-check can tell "not selected" from "failed".
+    """
+    return {}
 
-        default_openai = client.openai.get_client(deployment_id=default_deployment)
-        strip_openai = client.openai.get_client(deployment_id=strip_deployment)
 
-        prompt = [
-            {
-                "role": "user",
-                "content": "Think of 5 good names for a three-legged cat.",
-            }
-        ]
+@pytest.mark.requires_deployable_model
+@pytest.mark.parametrize("config_kind", ["default", "strip"])
+def test_deploy_qwen_and_infer(
+    live_kamiwaza_client, qwen_deployments, think_block_seen, config_kind
+):
+    think_block_seen[config_kind] = None
+    client = live_kamiwaza_client
+    deployment_id = qwen_deployments[config_kind]
+    if isinstance(deployment_id, BaseException):
+        raise deployment_id
+
+    details = client.serving.wait_for_deployment(
+        deployment_id,
+        poll_interval=5,
+        timeout=WAIT_TIMEOUT,
+    )
+    assert details.instances, f"{config_kind} deployment should report instances"
 
-        default_resp = default_openai.chat.completions.create(model="kamiwaza", messages=prompt, temperature=0.6)
-        strip_resp = strip_openai.chat.completions.create(model="kamiwaza", messages=prompt, temperature=0.6)
+    _sample_logs(client, deployment_id)
 
-        assert default_resp.choices, "Default deployment returned no choices"
-        assert strip_resp.choices, "Strip deployment returned no choices"
+    resp = client.openai.get_client(
+        deployment_id=deployment_id
+    ).chat.completions.create(model="kamiwaza", messages=PROMPT, temperature=0.6)
+    assert resp.choices, f"{config_kind} deployment returned no choices"
 
-        default_text = default_resp.choices[0].message.content or ""
-        strip_text = strip_resp.choices[0].message.content or ""
+    think_block_seen[config_kind] = _has_think_block(
+        resp.choices[0].message.content or ""
+    )
 
-        default_contains = "<think>" in default_text
-        strip_contains = "<think>" in strip_text
-        if default_contains:
-            assert not strip_contains, "Strip-thinking deployment should remove <think> blocks"
-    finally:
-        for dep in deployments:
-            try:
-                client.serving.stop_deployment(deployment_id=dep, force=True)
-            except Exception:
-                pass
-        try:
-            client.models.delete_model_config(strip_config.id)
-        except Exception:
-            pass
+
+def test_strip_thinking_removes_think_blocks(think_block_seen):
+    missing = {"default", "strip"} - set(think_block_seen)
+    if missing:
+        pytest.skip(f"test_deploy_qwen_and_infer variants not selected: {sorted(missing)}")
+    unrecorded = sorted(kind for kind, seen in think_block_seen.items() if seen is None)
+    if unrecorded:
+        pytest.fail(f"test_deploy_qwen_and_infer did not record a result for: {unrecorded}")
+    if think_block_seen["default"]:
+        assert not think_block_seen["strip"], (
+            "Strip-thinking deployment should remove <think> blocks"
+        )
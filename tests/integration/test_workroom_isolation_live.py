@@ -9,8 +9,10 @@ Validates the workroom access matrix from the architecture diagram:
     A <-> B (cross)          NEVER
     Global -> A or B         NEVER
 
-Each test creates ephemeral workrooms, populates resources via the
-X-Workroom-Id header, then asserts visibility rules hold.
+Each test class shares a pair of ephemeral workrooms, queries resources via
+the X-Workroom-Id header, then asserts visibility rules hold. Tests that
+archive or delete a workroom create their own inline. Every workroom created
+here is registered so anything left behind is swept at module teardown.
 
 Requirements:
     - A running Kamiwaza instance (auto-skips if unavailable)
@@ -18,6 +20,11 @@ Requirements:
 """
 from __future__ import annotations
 
+import itertools
+import logging
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from uuid import uuid4
 
 import pytest
@@ -25,45 +32,113 @@ import pytest
 from kamiwaza_sdk import KamiwazaClient
 from kamiwaza_sdk.exceptions import APIError, NotFoundError
 
-pytestmark = [pytest.mark.integration, pytest.mark.live, pytest.mark.withoutresponses]
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.live,
+    pytest.mark.withoutresponses,
+    # Under ``--dist loadgroup`` keep the workroom suite on one xdist worker.
+    pytest.mark.xdist_group("workrooms"),
+]
 
 GLOBAL_WORKROOM_ID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
 
+_logger = logging.getLogger(__name__)
+
+# One random run id per module import (and per xdist worker) plus a counter keeps
+# names unique without drawing fresh randomness for every workroom, and groups
+# a run's leftovers under a common suffix.
+_RUN_ID = uuid4().hex[:6]
+_SEQUENCE = itertools.count()
+
 
 def _unique(prefix: str) -> str:
-    return f"{prefix}-{uuid4().hex[:8]}"
+    return f"{prefix}-{_RUN_ID}{next(_SEQUENCE):02d}"
+
+
+def _create_workroom(sdk: KamiwazaClient, registry: set[str], prefix: str, **kwargs):
+    """Create an ephemeral workroom and record it for the module-level sweep."""
+    wr = sdk.workrooms.create(_unique(prefix), "ephemeral", **kwargs)
+    registry.add(str(wr.id))
+    return wr
+
+
+def _delete_workroom_quietly(sdk: KamiwazaClient, registry: set[str], workroom_id: str) -> None:
+    """Best-effort delete; a workroom that fails to delete stays registered for the sweep."""
+    try:
+        sdk.workrooms.delete(workroom_id)
+    except NotFoundError:
+        pass
+    except APIError:
+        return
+    registry.discard(workroom_id)
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def sdk(live_kamiwaza_client) -> KamiwazaClient:
-    """Authenticated SDK client."""
-    return live_kamiwaza_client
+@pytest.fixture(scope="module")
+def sdk(live_kamiwaza_session_client) -> KamiwazaClient:
+    """Authenticated SDK client, built once per session (and per xdist worker)."""
+    return live_kamiwaza_session_client
+
+
+@pytest.fixture(scope="module")
+def workroom_registry(sdk: KamiwazaClient) -> Iterator[set[str]]:
+    """IDs of workrooms this module created and has not yet deleted.
+
+    Anything still registered at module teardown -- a test that failed before
+    its own cleanup, or a delete that errored -- is swept here so ephemeral
+    workrooms don't accumulate on the live cluster.
+    """
+    registry: set[str] = set()
+    yield registry
+    for workroom_id in sorted(registry):
+        try:
+            sdk.workrooms.delete(workroom_id)
+        except NotFoundError:
+            pass
+        except Exception as exc:  # noqa: BLE001 — sweep is best-effort
+            _logger.warning("Could not delete leftover workroom %s: %s", workroom_id, exc)
 
 
-@pytest.fixture
-def workroom_a(sdk: KamiwazaClient):
-    """Create an ephemeral Workroom A, delete on teardown."""
-    wr = sdk.workrooms.create(_unique("wr-a"), "ephemeral", description="Isolation test A")
+@pytest.fixture(scope="class")
+def workroom_a(sdk: KamiwazaClient, workroom_registry: set[str]):
+    """Create an ephemeral Workroom A per test class, delete on teardown."""
+    wr = _create_workroom(sdk, workroom_registry, "wr-a", description="Isolation test A")
     yield wr
-    try:
-        sdk.workrooms.delete(str(wr.id))
-    except (APIError, NotFoundError):
-        pass
+    _delete_workroom_quietly(sdk, workroom_registry, str(wr.id))
 
 
-@pytest.fixture
-def workroom_b(sdk: KamiwazaClient):
-    """Create an ephemeral Workroom B, delete on teardown."""
-    wr = sdk.workrooms.create(_unique("wr-b"), "ephemeral", description="Isolation test B")
+@pytest.fixture(scope="class")
+def workroom_b(sdk: KamiwazaClient, workroom_registry: set[str]):
+    """Create an ephemeral Workroom B per test class, delete on teardown."""
+    wr = _create_workroom(sdk, workroom_registry, "wr-b", description="Isolation test B")
     yield wr
-    try:
-        sdk.workrooms.delete(str(wr.id))
-    except (APIError, NotFoundError):
-        pass
+    _delete_workroom_quietly(sdk, workroom_registry, str(wr.id))
+
+
+@pytest.fixture(scope="class")
+def workroom_a_id(workroom_a) -> str:
+    """Workroom A's id as the string the server reports in ``workroom_id``."""
+    return str(workroom_a.id)
+
+
+@pytest.fixture(scope="class")
+def workroom_b_id(workroom_b) -> str:
+    """Workroom B's id as the string the server reports in ``workroom_id``."""
+    return str(workroom_b.id)
+
+
+@pytest.fixture(scope="class")
+def connectors_by_workroom(
+    sdk: KamiwazaClient, workroom_a_id: str, workroom_b_id: str
+) -> dict[str, list]:
+    """Header-scoped connector listings for A and B, fetched once per class."""
+    workroom_ids = (workroom_a_id, workroom_b_id)
+    with ThreadPoolExecutor(max_workers=len(workroom_ids)) as executor:
+        listings = executor.map(partial(_list_connectors, sdk), workroom_ids)
+    return dict(zip(workroom_ids, listings))
 
 
 # ---------------------------------------------------------------------------
@@ -85,8 +160,8 @@ def _list_deployments(sdk: KamiwazaClient, workroom_id: str | None = None) -> li
     return resp if isinstance(resp, list) else resp.get("items", [])
 
 
-def _list_extensions(sdk: KamiwazaClient, workroom_id: str) -> list:
-    """List extensions scoped to a workroom via header."""
+def _list_extensions(sdk: KamiwazaClient, workroom_id: str) -> list[dict]:
+    """List extensions scoped to a workroom via header, as raw JSON dicts."""
     resp = sdk.get("/extensions", headers={"X-Workroom-Id": workroom_id})
     return resp if isinstance(resp, list) else resp.get("items", [])
 
@@ -129,17 +204,14 @@ class TestWorkroomCrudIsolation:
         updated = sdk.workrooms.update(str(workroom_a.id), description="updated-desc")
         assert updated.description == "updated-desc"
 
-    def test_archive_own_workroom(self, sdk):
+    def test_archive_own_workroom(self, sdk, workroom_registry):
         """A -> A: Owner can archive their own workroom."""
-        wr = sdk.workrooms.create(_unique("archive-test"), "ephemeral")
+        wr = _create_workroom(sdk, workroom_registry, "archive-test")
         try:
             archived = sdk.workrooms.archive(str(wr.id))
             assert archived.status == "archived"
         finally:
-            try:
-                sdk.workrooms.delete(str(wr.id))
-            except (APIError, NotFoundError):
-                pass
+            _delete_workroom_quietly(sdk, workroom_registry, str(wr.id))
 
 
 # ---------------------------------------------------------------------------
@@ -149,37 +221,28 @@ class TestWorkroomCrudIsolation:
 class TestSelfAccess:
     """Workspace A sees its own resources; B sees its own."""
 
-    def test_connectors_scoped_to_own_workroom(self, sdk, workroom_a, workroom_b):
+    def test_connectors_scoped_to_own_workroom(
+        self, workroom_a_id, workroom_b_id, connectors_by_workroom
+    ):
         """Connectors listed with A's header return only A's connectors."""
-        a_connectors = _list_connectors(sdk, str(workroom_a.id))
-        b_connectors = _list_connectors(sdk, str(workroom_b.id))
-
-        a_wids = {c.get("workroom_id") for c in a_connectors}
-        b_wids = {c.get("workroom_id") for c in b_connectors}
+        a_connectors = connectors_by_workroom[workroom_a_id]
+        b_connectors = connectors_by_workroom[workroom_b_id]
 
-        # Every connector returned for A must belong to A (or be empty)
-        for wid in a_wids:
-            if wid is not None:
-                assert wid == str(workroom_a.id), f"A sees non-A connector: {wid}"
+        # Every connector returned for A must belong to A (or be unscoped)
+        a_foreign = {c.get("workroom_id") for c in a_connectors} - {workroom_a_id, None}
+        b_foreign = {c.get("workroom_id") for c in b_connectors} - {workroom_b_id, None}
+        assert not a_foreign, f"A sees non-A connectors: {a_foreign}"
+        assert not b_foreign, f"B sees non-B connectors: {b_foreign}"
 
-        for wid in b_wids:
-            if wid is not None:
-                assert wid == str(workroom_b.id), f"B sees non-B connector: {wid}"
-
-    def test_extensions_scoped_to_own_workroom(self, sdk, workroom_a, workroom_b):
+    def test_extensions_scoped_to_own_workroom(self, sdk, workroom_a_id, workroom_b_id):
         """Extensions listed with A's header return only A's extensions."""
-        a_exts = _list_extensions(sdk, str(workroom_a.id))
-        b_exts = _list_extensions(sdk, str(workroom_b.id))
-
-        for ext in a_exts:
-            wid = ext.get("workroom_id") if isinstance(ext, dict) else getattr(ext, "workroom_id", None)
-            if wid is not None:
-                assert wid == str(workroom_a.id), f"A sees non-A extension: {wid}"
+        a_exts = _list_extensions(sdk, workroom_a_id)
+        b_exts = _list_extensions(sdk, workroom_b_id)
 
-        for ext in b_exts:
-            wid = ext.get("workroom_id") if isinstance(ext, dict) else getattr(ext, "workroom_id", None)
-            if wid is not None:
-                assert wid == str(workroom_b.id), f"B sees non-B extension: {wid}"
+        a_foreign = {ext.get("workroom_id") for ext in a_exts} - {workroom_a_id, None}
+        b_foreign = {ext.get("workroom_id") for ext in b_exts} - {workroom_b_id, None}
+        assert not a_foreign, f"A sees non-A extensions: {a_foreign}"
+        assert not b_foreign, f"B sees non-B extensions: {b_foreign}"
 
 
 # ---------------------------------------------------------------------------
@@ -189,28 +252,31 @@ class TestSelfAccess:
 class TestCrossWorkspaceBlocked:
     """Nothing outside of A can see into A; nothing outside of B can see into B."""
 
-    def test_b_cannot_see_a_connectors(self, sdk, workroom_a, workroom_b):
+    def test_b_cannot_see_a_connectors(
+        self, workroom_a_id, workroom_b_id, connectors_by_workroom
+    ):
         """B's connector listing must not include any of A's connectors."""
-        b_connectors = _list_connectors(sdk, str(workroom_b.id))
+        b_connectors = connectors_by_workroom[workroom_b_id]
         b_wids = {c.get("workroom_id") for c in b_connectors}
-        assert str(workroom_a.id) not in b_wids, "B sees A's connectors -- cross-workspace leak!"
+        assert workroom_a_id not in b_wids, "B sees A's connectors -- cross-workspace leak!"
 
-    def test_a_cannot_see_b_connectors(self, sdk, workroom_a, workroom_b):
+    def test_a_cannot_see_b_connectors(
+        self, workroom_a_id, workroom_b_id, connectors_by_workroom
+    ):
         """A's connector listing must not include any of B's connectors."""
-        a_connectors = _list_connectors(sdk, str(workroom_a.id))
+        a_connectors = connectors_by_workroom[workroom_a_id]
         a_wids = {c.get("workroom_id") for c in a_connectors}
-        assert str(workroom_b.id) not in a_wids, "A sees B's connectors -- cross-workspace leak!"
+        assert workroom_b_id not in a_wids, "A sees B's connectors -- cross-workspace leak!"
 
-    def test_b_cannot_see_a_extensions(self, sdk, workroom_a, workroom_b):
+    def test_b_cannot_see_a_extensions(self, sdk, workroom_a_id, workroom_b_id):
         """B's extension listing must not include any of A's extensions."""
-        b_exts = _list_extensions(sdk, str(workroom_b.id))
-        for ext in b_exts:
-            wid = ext.get("workroom_id") if isinstance(ext, dict) else getattr(ext, "workroom_id", None)
-            assert wid != str(workroom_a.id), "B sees A's extension -- cross-workspace leak!"
+        b_exts = _list_extensions(sdk, workroom_b_id)
+        b_wids = {ext.get("workroom_id") for ext in b_exts}
+        assert workroom_a_id not in b_wids, "B sees A's extension -- cross-workspace leak!"
 
-    def test_workroom_export_only_shows_own_resources(self, sdk, workroom_a):
+    def test_workroom_export_only_shows_own_resources(self, sdk, workroom_a, workroom_a_id):
         """Export manifest for A should not reference B's resources."""
-        manifest = sdk.workrooms.get_export_manifest(str(workroom_a.id))
+        manifest = sdk.workrooms.get_export_manifest(workroom_a_id)
         assert manifest.workroom_id == workroom_a.id
         # Every item in the manifest belongs to A (the workroom being exported)
         assert len(manifest.items) >= 1  # At minimum: metadata item
@@ -223,20 +289,19 @@ class TestCrossWorkspaceBlocked:
 class TestGlobalCannotSeeWorkspaces:
     """From Global Workroom context, workspace-scoped resources are invisible."""
 
-    def test_global_connectors_exclude_workspace_a(self, sdk, workroom_a):
+    def test_global_connectors_exclude_workspace_a(self, sdk, workroom_a_id):
         """Connectors listed under Global must not include A's connectors."""
         global_connectors = _list_connectors(sdk, GLOBAL_WORKROOM_ID)
         global_wids = {c.get("workroom_id") for c in global_connectors}
-        assert str(workroom_a.id) not in global_wids, \
+        assert workroom_a_id not in global_wids, \
             "Global sees Workspace A's connectors -- Global->Workspace leak!"
 
-    def test_global_extensions_exclude_workspace_b(self, sdk, workroom_b):
+    def test_global_extensions_exclude_workspace_b(self, sdk, workroom_b_id):
         """Extensions listed under Global must not include B's extensions."""
         global_exts = _list_extensions(sdk, GLOBAL_WORKROOM_ID)
-        for ext in global_exts:
-            wid = ext.get("workroom_id") if isinstance(ext, dict) else getattr(ext, "workroom_id", None)
-            assert wid != str(workroom_b.id), \
-                "Global sees Workspace B's extension -- Global->Workspace leak!"
+        global_wids = {ext.get("workroom_id") for ext in global_exts}
+        assert workroom_b_id not in global_wids, \
+            "Global sees Workspace B's extension -- Global->Workspace leak!"
 
     def test_global_export_excludes_workspace_resources(self, sdk):
         """Export manifest for Global should not reference workspace-scoped resources."""
@@ -257,26 +322,39 @@ class TestWorkspaceCanSeeGlobal:
     in Workspace A can still query Global.
     """
 
-    def test_workspace_user_can_read_global_workroom(self, sdk, workroom_a):
-        """User who owns Workspace A can also read the Global Workroom."""
-        global_wr = sdk.workrooms.get(GLOBAL_WORKROOM_ID)
-        assert str(global_wr.id) == GLOBAL_WORKROOM_ID
-
-    def test_workspace_user_can_list_global_connectors(self, sdk, workroom_a):
+    @pytest.fixture(scope="class")
+    def global_reads(self, sdk, workroom_a) -> dict[str, Future]:
+        """Issue the independent Global reads once, concurrently, while A exists.
+
+        Futures are returned so each test surfaces only its own read's error.
+        """
+        reads = {
+            "workroom": partial(sdk.workrooms.get, GLOBAL_WORKROOM_ID),
+            "connectors": partial(_list_connectors, sdk, GLOBAL_WORKROOM_ID),
+            "export_manifest": partial(sdk.workrooms.get_export_manifest, GLOBAL_WORKROOM_ID),
+            "ingestion_summary": partial(sdk.workrooms.get_ingestion_summary, GLOBAL_WORKROOM_ID),
+        }
+        with ThreadPoolExecutor(max_workers=len(reads)) as executor:
+            return {name: executor.submit(read) for name, read in reads.items()}
+
+    @pytest.mark.parametrize(
+        ("read", "id_attr"),
+        [
+            ("workroom", "id"),
+            ("export_manifest", "workroom_id"),
+            ("ingestion_summary", "workroom_id"),
+        ],
+    )
+    def test_workspace_user_can_read_global(self, global_reads, read, id_attr):
+        """User in Workspace A can read the Global Workroom, its export manifest and summary."""
+        result = global_reads[read].result()
+        assert str(getattr(result, id_attr)) == GLOBAL_WORKROOM_ID
+
+    def test_workspace_user_can_list_global_connectors(self, global_reads):
         """User in Workspace A can query Global Workroom connectors."""
-        global_connectors = _list_connectors(sdk, GLOBAL_WORKROOM_ID)
+        global_connectors = global_reads["connectors"].result()
         assert isinstance(global_connectors, list)
 
-    def test_workspace_user_can_get_global_export_manifest(self, sdk, workroom_a):
-        """User in Workspace A can get Global Workroom export manifest."""
-        manifest = sdk.workrooms.get_export_manifest(GLOBAL_WORKROOM_ID)
-        assert str(manifest.workroom_id) == GLOBAL_WORKROOM_ID
-
-    def test_workspace_user_can_get_global_ingestion_summary(self, sdk, workroom_a):
-        """User in Workspace A can get Global Workroom ingestion summary."""
-        summary = sdk.workrooms.get_ingestion_summary(GLOBAL_WORKROOM_ID)
-        assert str(summary.workroom_id) == GLOBAL_WORKROOM_ID
-
 
 # ---------------------------------------------------------------------------
 # 6. LIFECYCLE + ISOLATION INTERACTIONS
@@ -285,14 +363,15 @@ class TestWorkspaceCanSeeGlobal:
 class TestLifecycleIsolation:
     """Verify workroom lifecycle operations don't break isolation."""
 
-    def test_delete_workroom_does_not_affect_other(self, sdk, workroom_b):
+    def test_delete_workroom_does_not_affect_other(self, sdk, workroom_b, workroom_registry):
         """Deleting Workspace A does not affect Workspace B."""
-        wr_a = sdk.workrooms.create(_unique("delete-test"), "ephemeral")
+        wr_a = _create_workroom(sdk, workroom_registry, "delete-test")
         a_id = str(wr_a.id)
 
         # Delete A
         result = sdk.workrooms.delete(a_id)
         assert result.status == "deleted"
+        workroom_registry.discard(a_id)
 
         # B is untouched
         fetched_b = sdk.workrooms.get(str(workroom_b.id))
@@ -302,9 +381,9 @@ class TestLifecycleIsolation:
         with pytest.raises(NotFoundError):
             sdk.workrooms.get(a_id)
 
-    def test_archive_workroom_still_visible_with_flag(self, sdk):
+    def test_archive_workroom_still_visible_with_flag(self, sdk, workroom_registry):
         """Archived workroom appears when include_archived=True."""
-        wr = sdk.workrooms.create(_unique("archive-vis"), "ephemeral")
+        wr = _create_workroom(sdk, workroom_registry, "archive-vis")
         try:
             sdk.workrooms.archive(str(wr.id))
 
@@ -313,10 +392,7 @@ class TestLifecycleIsolation:
             all_ids = {str(w.id) for w in all_wrs}
             assert str(wr.id) in all_ids
         finally:
-            try:
-                sdk.workrooms.delete(str(wr.id))
-            except (APIError, NotFoundError):
-                pass
+            _delete_workroom_quietly(sdk, workroom_registry, str(wr.id))
 
 
 # ---------------------------------------------------------------------------
@@ -326,7 +402,7 @@ class TestLifecycleIsolation:
 class TestSentinelAllBypass:
     """The ?workroom_id=all sentinel bypasses workroom filtering (admin use)."""
 
-    def test_deployments_all_returns_across_workrooms(self, sdk, workroom_a, workroom_b):
+    def test_deployments_all_returns_across_workrooms(self, sdk):
         """Passing workroom_id=all returns deployments from all workrooms."""
         all_deployments = _list_deployments(sdk, workroom_id="all")
         assert isinstance(all_deployments, list)
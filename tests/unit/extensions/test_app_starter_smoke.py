@@ -607,6 +607,8 @@ def test_home_short_circuits_authguard_for_anonymous_session(page_path):
 
 
 @pytest.mark.slow
+# Both variants may npm-install into the shared kamiwaza-ai-extensions-lib checkout.
+@pytest.mark.xdist_group("extensions-lib-npm")
 @pytest.mark.parametrize(
     ("source_name", "factory"),
     [
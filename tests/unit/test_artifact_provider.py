@@ -36,15 +36,20 @@ def test_register_and_fetch_provider(monkeypatch):
     assert dummy.calls[0][0] == "demo/model"
 
 
-def test_default_provider_downloads_snapshot(monkeypatch, tmp_path):
+@pytest.fixture(scope="module")
+def fake_snapshot_dir(tmp_path_factory):
+    """Pre-populated snapshot directory shared by the fake ``snapshot_download``."""
+    target = tmp_path_factory.mktemp("snapshot")
+    (target / "README.md").write_text("mlx-community")
+    return target
+
+
+def test_default_provider_downloads_snapshot(monkeypatch, tmp_path, fake_snapshot_dir):
     provider = get_provider()
 
     def fake_snapshot(repo_id, **kwargs):
         assert repo_id == "mlx-community/Qwen3-4B-4bit"
-        target = tmp_path / "snapshot"
-        target.mkdir()
-        (target / "README.md").write_text("mlx-community")
-        return str(target)
+        return str(fake_snapshot_dir)
 
     monkeypatch.setattr("kamiwaza_sdk.artifacts.providers.snapshot_download", fake_snapshot)
     path = provider.download(
@@ -51,7 +51,7 @@ def test_create_pat_round_trip(dummy_client):
     client = dummy_client(responses)
     service = AuthService(client)
 
-    payload = PATCreate(name="sdk", ttl_seconds=60)
+    payload = PATCreate.model_construct(name="sdk", ttl_seconds=60)
     result = service.create_pat(payload)
 
     assert result.token == "pat-token"
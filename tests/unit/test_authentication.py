@@ -1,30 +1,21 @@
 from __future__ import annotations
 
 import pytest
-import requests
 from datetime import datetime, timedelta, timezone
-import time
+from types import SimpleNamespace
+
+from requests.cookies import RequestsCookieJar
 
 from kamiwaza_sdk.authentication import UserPasswordAuthenticator
-from kamiwaza_sdk.token_store import StoredToken, TokenStore
+from kamiwaza_sdk.token_store import StoredToken
 from kamiwaza_sdk.exceptions import AuthenticationError
 from kamiwaza_sdk.schemas.auth import TokenResponse
 
 pytestmark = pytest.mark.unit
 
-
-class MemoryTokenStore(TokenStore):
-    def __init__(self):
-        self.value: StoredToken | None = None
-
-    def load(self):
-        return self.value
-
-    def save(self, token: StoredToken):
-        self.value = token
-
-    def clear(self):
-        self.value = None
+# Token payloads are immutable value objects; validate them once per module.
+PASSWORD_GRANT_TOKEN = TokenResponse(access_token="token-1", expires_in=60, refresh_token="refresh-1")
+REFRESHED_TOKEN = TokenResponse(access_token="token-2", expires_in=60, refresh_token="refresh-2")
 
 
 class DummyAuthService:
@@ -60,13 +51,18 @@ class DummyAuthService:
         return self.refresh_response
 
 
-def test_user_password_authenticator_performs_password_grant():
-    token = TokenResponse(access_token="token-1", expires_in=60, refresh_token="refresh-1")
+@pytest.fixture
+def session():
+    """Stand-in for ``requests.Session``; authenticators only touch headers and cookies."""
+    return SimpleNamespace(headers={}, cookies=RequestsCookieJar())
+
+
+def test_user_password_authenticator_performs_password_grant(session, memory_token_store):
+    token = PASSWORD_GRANT_TOKEN
     auth_service = DummyAuthService(login_response=token)
-    store = MemoryTokenStore()
+    store = memory_token_store
     authenticator = UserPasswordAuthenticator("admin", "secret", auth_service, token_store=store)
 
-    session = requests.Session()
     authenticator.authenticate(session)
 
     assert auth_service.login_calls == [("admin", "secret")]
@@ -76,17 +72,23 @@ def test_user_password_authenticator_performs_password_grant():
     assert store.value is not None
 
 
-def test_user_password_authenticator_prefers_refresh_when_token_expires():
-    login_token = TokenResponse(access_token="token-1", expires_in=1, refresh_token="refresh-1")
-    refresh_token = TokenResponse(access_token="token-2", expires_in=60, refresh_token="refresh-2")
-    auth_service = DummyAuthService(login_response=login_token, refresh_response=refresh_token)
-    store = MemoryTokenStore()
-    authenticator = UserPasswordAuthenticator("admin", "secret", auth_service, token_store=store)
-    session = requests.Session()
+def test_user_password_authenticator_prefers_refresh_when_token_expires(session, memory_token_store):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    refresh_token = REFRESHED_TOKEN
+    auth_service = DummyAuthService(
+        login_response=PASSWORD_GRANT_TOKEN, refresh_response=refresh_token
+    )
+    store = memory_token_store
+    authenticator = UserPasswordAuthenticator(
+        "admin", "secret", auth_service, token_store=store, clock=lambda: now
+    )
 
     authenticator.authenticate(session)
-    # Force expiry to trigger refresh path
-    authenticator.token_expiry = datetime.now(timezone.utc) - timedelta(seconds=1)
+    authenticator.authenticate(session)
+    assert auth_service.refresh_calls == []
+
+    # Advance past expiry to trigger the refresh path
+    now += timedelta(seconds=PASSWORD_GRANT_TOKEN.expires_in)
     authenticator.authenticate(session)
 
     assert auth_service.login_calls == [("admin", "secret")]
@@ -94,28 +96,49 @@ def test_user_password_authenticator_prefers_refresh_when_token_expires():
     assert session.headers["Authorization"] == f"Bearer {refresh_token.access_token}"
     assert authenticator.token == refresh_token.access_token
     assert authenticator.refresh_token_value == refresh_token.refresh_token
+    assert authenticator.token_expiry == now + timedelta(seconds=refresh_token.expires_in)
     assert store.value and store.value.access_token == refresh_token.access_token
 
 
-def test_user_password_authenticator_raises_when_login_fails():
+def test_user_password_authenticator_raises_when_login_fails(session, memory_token_store):
     auth_service = DummyAuthService(
         login_error=RuntimeError("bad credentials"),
     )
-    authenticator = UserPasswordAuthenticator("admin", "wrong", auth_service, token_store=MemoryTokenStore())
-    session = requests.Session()
+    authenticator = UserPasswordAuthenticator("admin", "wrong", auth_service, token_store=memory_token_store)
 
     with pytest.raises(AuthenticationError):
         authenticator.authenticate(session)
 
 
-def test_user_password_authenticator_uses_cached_token():
-    store = MemoryTokenStore()
-    store.value = StoredToken(access_token="cached", refresh_token=None, expires_at=time.time() + 60)
+def test_user_password_authenticator_uses_cached_token(session, memory_token_store):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    store = memory_token_store
+    store.value = StoredToken(
+        access_token="cached",
+        refresh_token=None,
+        expires_at=(now + timedelta(hours=1)).timestamp(),
+    )
     auth_service = DummyAuthService(login_error=RuntimeError("should not login"))
-    authenticator = UserPasswordAuthenticator("admin", "secret", auth_service, token_store=store)
-    session = requests.Session()
+    authenticator = UserPasswordAuthenticator(
+        "admin", "secret", auth_service, token_store=store, clock=lambda: now
+    )
 
     authenticator.authenticate(session)
 
     assert auth_service.login_calls == []
     assert session.headers["Authorization"] == "Bearer cached"
+
+
+def test_user_password_authenticator_discards_cached_token_expired_by_clock(session, memory_token_store):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    store = memory_token_store
+    store.value = StoredToken(access_token="cached", refresh_token=None, expires_at=now.timestamp())
+    auth_service = DummyAuthService(login_response=PASSWORD_GRANT_TOKEN)
+    authenticator = UserPasswordAuthenticator(
+        "admin", "secret", auth_service, token_store=store, clock=lambda: now
+    )
+
+    authenticator.authenticate(session)
+
+    assert auth_service.login_calls == [("admin", "secret")]
+    assert session.headers["Authorization"] == f"Bearer {PASSWORD_GRANT_TOKEN.access_token}"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
 
 from kamiwaza_sdk.exceptions import APIError
@@ -8,10 +10,17 @@ from kamiwaza_sdk.services.catalog import CatalogService, ContainerClient, Datas
 
 pytestmark = pytest.mark.unit
 
+DATASET_URN = "urn:li:dataset:(s3,my,PROD)"
+SECRET_URN = "urn:li:dataHubSecret:demo"
+# Read-only: services only validate it into a model.
+SECRET_RESPONSE = MappingProxyType(
+    {"urn": SECRET_URN, "name": "demo", "owner": "urn:li:corpuser:demo"}
+)
+
 
 def test_catalog_service_create_dataset_roundtrip(dummy_client):
     dataset_response = {
-        "urn": "urn:li:dataset:(s3,my,PROD)",
+        "urn": DATASET_URN,
         "name": "/tmp/data",
         "platform": "s3",
         "environment": "PROD",
@@ -41,7 +50,7 @@ def test_container_membership_helpers_use_query_endpoints(dummy_client):
     client = dummy_client(responses)
     containers = ContainerClient(client)
 
-    containers.create(ContainerCreate(name="demo"))
+    containers.create(ContainerCreate.model_construct(name="demo"))
     containers.add_dataset("container", "dataset")
     containers.remove_dataset("container", "dataset")
 
@@ -51,39 +60,33 @@ def test_container_membership_helpers_use_query_endpoints(dummy_client):
     assert add_kwargs["json"]["dataset_urn"] == "dataset"
 
 
-def test_secret_client_sets_clobber_flag(dummy_client):
-    expected_urn = "urn:li:dataHubSecret:demo"
-    responses = {
-        ("post", "/catalog/secrets/"): expected_urn,
-        ("get", "/catalog/secrets/v2/urn:li:dataHubSecret:demo"): {
-            "urn": expected_urn,
-            "name": "demo",
-            "owner": "urn:li:corpuser:demo",
-        },
-    }
-    client = dummy_client(responses)
+@pytest.mark.parametrize(
+    ("clobber", "create_response"),
+    [
+        pytest.param(True, SECRET_URN, id="clobber-bare-urn"),
+        pytest.param(False, {"urn": SECRET_URN}, id="no-clobber-wrapped-urn"),
+    ],
+)
+def test_secret_client_sets_clobber_flag(dummy_client, clobber, create_response):
+    client = dummy_client({("post", "/catalog/secrets/"): create_response})
     secrets = SecretClient(client)
 
     urn = secrets.create(
         SecretCreate(name="demo", value="hunter2", owner="urn:li:corpuser:demo"),
-        clobber=True,
+        clobber=clobber,
     )
-    assert urn == expected_urn
+    assert urn == SECRET_URN
     method, path, kwargs = client.calls[0]
-    assert kwargs["params"]["clobber"] == "true"
+    assert kwargs["params"]["clobber"] == str(clobber).lower()
     assert kwargs["json"]["value"] == "hunter2"
 
 
 def test_secret_client_preserves_opaque_urn(dummy_client):
-    expected_urn = "urn:li:dataHubSecret:demo"
+    expected_urn = SECRET_URN
     raw = expected_urn
     responses = {
         ("post", "/catalog/secrets/"): {"urn": expected_urn},
-        ("get", f"/catalog/secrets/v2/{raw}"): {
-            "urn": expected_urn,
-            "name": "demo",
-            "owner": "urn:li:corpuser:demo",
-        },
+        ("get", f"/catalog/secrets/v2/{raw}"): SECRET_RESPONSE,
         ("delete", f"/catalog/secrets/v2/{raw}"): {},
     }
     client = dummy_client(responses)
@@ -109,7 +112,7 @@ def test_dataset_client_encode_helper():
 
 
 def test_catalog_service_normalizes_path_to_location(dummy_client):
-    dataset_urn = "urn:li:dataset:(s3,my,PROD)"
+    dataset_urn = DATASET_URN
     dataset_response = {
         "urn": dataset_urn,
         "name": "demo",
@@ -131,7 +134,7 @@ def test_catalog_service_normalizes_path_to_location(dummy_client):
 
 
 def test_catalog_service_normalizes_location_to_path(dummy_client):
-    dataset_urn = "urn:li:dataset:(s3,my,PROD)"
+    dataset_urn = DATASET_URN
     raw_properties = {"location": "s3://bucket/key"}
     list_payload = [
         {
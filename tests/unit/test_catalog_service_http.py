@@ -0,0 +1,95 @@
+"""Recorded-HTTP counterparts of selected ``test_catalog_service.py`` cases.
+
+``test_catalog_service.py`` drives the services through ``DummyAPIClient``,
+which never builds a request. These replay the same calls through a real
+``KamiwazaClient`` so URL/query encoding and JSON (de)serialization are
+covered as well.
+"""
+
+from __future__ import annotations
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import responses
+from responses import matchers
+
+from kamiwaza_sdk.client import KamiwazaClient
+from kamiwaza_sdk.schemas.catalog import SecretCreate
+
+pytestmark = pytest.mark.contract
+
+BASE_URL = "https://kamiwaza.test/api"
+DATASET_URN = "urn:li:dataset:(s3,my,PROD)"
+DATASET_RESPONSE = {
+    "urn": DATASET_URN,
+    "name": "/tmp/data",
+    "platform": "s3",
+    "environment": "PROD",
+    "tags": [],
+    "properties": {"path": "s3://bucket/key"},
+}
+
+
+@pytest.fixture
+def client() -> KamiwazaClient:
+    return KamiwazaClient(BASE_URL, api_key="test-key")
+
+
+def test_create_dataset_roundtrip(client: KamiwazaClient) -> None:
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/catalog/datasets/",
+        json=DATASET_URN,
+        match=[
+            matchers.json_params_matcher(
+                {"name": "/tmp/data", "platform": "s3", "environment": "PROD"},
+                strict_match=False,
+            )
+        ],
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/catalog/datasets/by-urn",
+        json=DATASET_RESPONSE,
+        match=[matchers.query_param_matcher({"urn": DATASET_URN})],
+    )
+
+    dataset = client.catalog.create_dataset(dataset_name="/tmp/data", platform="s3")
+
+    assert dataset.urn == DATASET_URN
+    assert dataset.properties["location"] == "s3://bucket/key"
+    assert len(responses.calls) == 2
+
+
+def test_list_datasets_sends_query(client: KamiwazaClient) -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/catalog/datasets/",
+        json=[DATASET_RESPONSE],
+        match=[matchers.query_param_matcher({"query": "my data"})],
+    )
+
+    datasets = client.catalog.list_datasets(query="my data")
+
+    assert [dataset.urn for dataset in datasets] == [DATASET_URN]
+
+
+def test_secret_create_sends_clobber_flag_and_revealed_value(client: KamiwazaClient) -> None:
+    expected_urn = "urn:li:dataHubSecret:demo"
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/catalog/secrets/",
+        json={"urn": expected_urn},
+    )
+
+    urn = client.catalog.secrets.create(
+        SecretCreate(name="demo", value="hunter2", owner="urn:li:corpuser:demo"),
+        clobber=True,
+    )
+
+    assert urn == expected_urn
+    request = responses.calls[0].request
+    assert parse_qs(urlsplit(request.url).query) == {"clobber": ["true"]}
+    assert json.loads(request.body)["value"] == "hunter2"
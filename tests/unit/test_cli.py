@@ -1,35 +1,74 @@
 from __future__ import annotations
 
 import argparse
-import time
 from types import SimpleNamespace
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
 from kamiwaza_sdk import cli
 from kamiwaza_sdk.exceptions import AuthenticationError
-from kamiwaza_sdk.token_store import StoredToken, TokenStore
+from kamiwaza_sdk.token_store import StoredToken
 
 pytestmark = pytest.mark.unit
 
+_NOW = 1_700_000_000.0
+_CACHED_TOKEN_EXPIRY = _NOW + 60
 
-class MemoryStore(TokenStore):
-    def __init__(self):
-        self.value: StoredToken | None = None
+MODEL_ID = UUID("00000000-0000-4000-8000-000000000001")
+DEPLOYMENT_ID = UUID("00000000-0000-4000-8000-000000000002")
 
-    def load(self):
-        return self.value
 
-    def save(self, token: StoredToken):
-        self.value = token
+@pytest.fixture(autouse=True)
+def _frozen_clock(monkeypatch):
+    """Pin ``time.time`` for the CLI and token store; the rest of ``time`` stays real."""
+    # Both modules do ``import time``, so this one patch covers them.
+    monkeypatch.setattr("kamiwaza_sdk.cli.time.time", lambda: _NOW)
 
-    def clear(self):
-        self.value = None
 
+class FakeAuthenticator:
+    def __init__(self, username, password, auth_service, *, token_store):
+        self.username = username
+        self.password = password
+        self.auth_service = auth_service
+        self.token_store = token_store
 
-def test_login_command_uses_authenticator(monkeypatch):
-    store = MemoryStore()
+    def authenticate(self, session):
+        session.headers["Authorization"] = "Bearer fake"
+        self.token_store.save(StoredToken(access_token="fake", refresh_token=None, expires_at=_CACHED_TOKEN_EXPIRY))
+
+
+class FakeAuth:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def create_pat(self, payload):
+        self.calls["payload"] = payload
+        pat = SimpleNamespace(exp=_NOW + 300)
+        return SimpleNamespace(token="new-token", pat=pat)
+
+    def revoke_pat(self, jti):
+        self.calls["revoked"] = jti
+
+
+class FakeServing:
+    def __init__(self, deployment_id, waited):
+        self.deployment_id = deployment_id
+        self.waited = waited
+        self.deploy_calls = []
+
+    def deploy_model(self, **kwargs):
+        self.deploy_calls.append(kwargs)
+        return self.deployment_id
+
+    def wait_for_deployment(self, dep_id, **kwargs):
+        assert dep_id == self.deployment_id
+        self.wait_kwargs = kwargs
+        return self.waited
+
+
+def test_login_command_uses_authenticator(memory_token_store):
+    store = memory_token_store
     args = argparse.Namespace(base_url="https://localhost/api", username="admin", password="secret", token_path=None)
     fake_client = SimpleNamespace(auth="auth-service", session=SimpleNamespace(headers={}))
 
@@ -37,17 +76,6 @@ def test_login_command_uses_authenticator(monkeypatch):
         assert base_url == args.base_url
         return fake_client
 
-    class FakeAuthenticator:
-        def __init__(self, username, password, auth_service, *, token_store):
-            self.username = username
-            self.password = password
-            self.auth_service = auth_service
-            self.token_store = token_store
-
-        def authenticate(self, session):
-            session.headers["Authorization"] = "Bearer fake"
-            self.token_store.save(StoredToken(access_token="fake", refresh_token=None, expires_at=time.time() + 60))
-
     cli.login_command(
         args,
         client_factory=factory,
@@ -58,8 +86,8 @@ def test_login_command_uses_authenticator(monkeypatch):
     assert store.value and store.value.access_token == "fake"
 
 
-def test_pat_create_command_requires_cached_token():
-    store = MemoryStore()
+def test_pat_create_command_requires_cached_token(memory_token_store):
+    store = memory_token_store
     args = argparse.Namespace(
         base_url="https://localhost/api",
         token_path=None,
@@ -71,13 +99,13 @@ def test_pat_create_command_requires_cached_token():
         revoke_jti=None,
     )
 
-    with pytest.raises(AuthenticationError):
+    with pytest.raises(AuthenticationError, match="Login first"):
         cli.pat_create_command(args, token_store=store, client_factory=lambda *_args, **_kwargs: None)  # type: ignore
 
 
-def test_pat_create_command_creates_and_caches_token(monkeypatch):
-    store = MemoryStore()
-    store.save(StoredToken(access_token="session", refresh_token="ref", expires_at=time.time() + 60))
+def test_pat_create_command_creates_and_caches_token(memory_token_store):
+    store = memory_token_store
+    store.save(StoredToken(access_token="session", refresh_token="ref", expires_at=_CACHED_TOKEN_EXPIRY))
 
     args = argparse.Namespace(
         base_url="https://localhost/api",
@@ -92,18 +120,9 @@ def test_pat_create_command_creates_and_caches_token(monkeypatch):
 
     create_called = {}
 
-    class FakeAuth:
-        def create_pat(self, payload):
-            create_called["payload"] = payload
-            pat = SimpleNamespace(exp=time.time() + 300)
-            return SimpleNamespace(token="new-token", pat=pat)
-
-        def revoke_pat(self, jti):
-            create_called["revoked"] = jti
-
     def factory(base_url, api_key):
         assert api_key == "session"
-        return SimpleNamespace(auth=FakeAuth())
+        return SimpleNamespace(auth=FakeAuth(create_called))
 
     token = cli.pat_create_command(args, token_store=store, client_factory=factory)
 
@@ -113,59 +132,47 @@ def test_pat_create_command_creates_and_caches_token(monkeypatch):
     assert create_called["revoked"] == "old-jti"
 
 
+_SERVE_DEFAULTS = {
+    "base_url": "https://localhost/api",
+    "token_path": None,
+    "model_id": str(MODEL_ID),
+    "repo_id": None,
+    "config_id": None,
+    "file_id": None,
+    "engine_name": None,
+    "lb_port": 0,
+    "min_copies": 1,
+    "starting_copies": 1,
+    "max_copies": None,
+    "duration": None,
+    "autoscaling": False,
+    "force_cpu": False,
+    "wait": False,
+    "poll_interval": 1.0,
+    "timeout": 5.0,
+}
+
+
 def _serve_args(**overrides):
-    defaults = dict(
-        base_url="https://localhost/api",
-        token_path=None,
-        model_id=str(uuid4()),
-        repo_id=None,
-        config_id=None,
-        file_id=None,
-        engine_name=None,
-        lb_port=0,
-        min_copies=1,
-        starting_copies=1,
-        max_copies=None,
-        duration=None,
-        autoscaling=False,
-        force_cpu=False,
-        wait=False,
-        poll_interval=1.0,
-        timeout=5.0,
-    )
-    defaults.update(overrides)
-    return argparse.Namespace(**defaults)
+    return argparse.Namespace(**{**_SERVE_DEFAULTS, **overrides})
 
 
-def test_serve_deploy_command_requires_cached_token():
-    store = MemoryStore()
+def test_serve_deploy_command_requires_cached_token(memory_token_store):
+    store = memory_token_store
     args = _serve_args()
 
-    with pytest.raises(AuthenticationError):
+    with pytest.raises(AuthenticationError, match="Login first"):
         cli.serve_deploy_command(args, token_store=store, client_factory=lambda *_args, **_kwargs: None)  # type: ignore[arg-type]
 
 
-def test_serve_deploy_command_invokes_service(monkeypatch):
-    store = MemoryStore()
-    store.save(StoredToken(access_token="session", refresh_token=None, expires_at=time.time() + 60))
+def test_serve_deploy_command_invokes_service(memory_token_store):
+    store = memory_token_store
+    store.save(StoredToken(access_token="session", refresh_token=None, expires_at=_CACHED_TOKEN_EXPIRY))
 
-    deployment_id = uuid4()
+    deployment_id = DEPLOYMENT_ID
     waited = SimpleNamespace(status="DEPLOYED")
 
-    class FakeServing:
-        def __init__(self):
-            self.deploy_calls = []
-
-        def deploy_model(self, **kwargs):
-            self.deploy_calls.append(kwargs)
-            return deployment_id
-
-        def wait_for_deployment(self, dep_id, **kwargs):
-            assert dep_id == deployment_id
-            self.wait_kwargs = kwargs
-            return waited
-
-    fake_serving = FakeServing()
+    fake_serving = FakeServing(deployment_id, waited)
     client = SimpleNamespace(serving=fake_serving)
 
     def factory(base_url, api_key):
@@ -176,7 +183,6 @@ def test_serve_deploy_command_invokes_service(monkeypatch):
 
     summary = cli.serve_deploy_command(args, token_store=store, client_factory=factory)
 
-    assert summary["deployment_id"] == str(deployment_id)
-    assert summary["status"] == "DEPLOYED"
+    assert summary == {"deployment_id": str(deployment_id), "status": "DEPLOYED"}
     assert fake_serving.deploy_calls, "Expected deploy_model to be invoked"
     assert fake_serving.wait_kwargs == {"poll_interval": 0.5, "timeout": 2.5}
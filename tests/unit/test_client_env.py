@@ -9,37 +9,37 @@ from kamiwaza_sdk.authentication import ApiKeyAuthenticator
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
 def _clear_base_env(monkeypatch):
+    """Start every test from an environment with no client config set."""
     monkeypatch.delenv("KAMIWAZA_BASE_URL", raising=False)
     monkeypatch.delenv("KAMIWAZA_BASE_URI", raising=False)
     monkeypatch.delenv("KAMIWAZA_VERIFY_SSL", raising=False)
     monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+    # tests/conftest.py may have loaded credentials from .env.local.
+    monkeypatch.delenv("KAMIWAZA_API_KEY", raising=False)
+    monkeypatch.delenv("KAMIWAZA_API_TOKEN", raising=False)
 
 
-def test_client_requires_base_url_when_no_env(monkeypatch):
-    _clear_base_env(monkeypatch)
+def test_client_requires_base_url_when_no_env():
     with pytest.raises(ValueError):
         KamiwazaClient()
 
 
 def test_client_uses_base_url_env(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     client = KamiwazaClient()
     assert client.base_url == "https://env.example/api"
 
 
 def test_client_uses_base_uri_env(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URI", "https://uri.example/api")
     client = KamiwazaClient()
     assert client.base_url == "https://uri.example/api"
 
 
 def test_client_uses_api_token_env(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
-    monkeypatch.delenv("KAMIWAZA_API_KEY", raising=False)
     monkeypatch.setenv("KAMIWAZA_API_TOKEN", "pat-from-env")
     client = KamiwazaClient()
     assert isinstance(client.authenticator, ApiKeyAuthenticator)
@@ -56,7 +56,6 @@ class _NoContentResponse:
 
 
 def test_client_disables_ssl_verification_from_env(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
 
@@ -66,7 +65,6 @@ def test_client_disables_ssl_verification_from_env(monkeypatch):
 
 
 def test_client_disables_ssl_verification_for_falsey_env_values(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", " no ")
 
@@ -76,7 +74,6 @@ def test_client_disables_ssl_verification_for_falsey_env_values(monkeypatch):
 
 
 def test_client_request_forces_verify_false_when_ssl_disabled(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/certs/ca-certificates.crt")
@@ -96,7 +93,6 @@ def test_client_request_forces_verify_false_when_ssl_disabled(monkeypatch):
 
 
 def test_client_request_injects_session_verify_when_ssl_enabled(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     client = KamiwazaClient()
     calls: list[dict[str, object]] = []
@@ -113,7 +109,6 @@ def test_client_request_injects_session_verify_when_ssl_enabled(monkeypatch):
 
 
 def test_client_request_preserves_explicit_verify_override(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     client = KamiwazaClient()
@@ -131,7 +126,6 @@ def test_client_request_preserves_explicit_verify_override(monkeypatch):
 
 
 def test_client_request_preserves_explicit_verify_false(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     client = KamiwazaClient()
@@ -149,7 +143,6 @@ def test_client_request_preserves_explicit_verify_false(monkeypatch):
 
 
 def test_client_request_preserves_explicit_verify_none(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     client = KamiwazaClient()
@@ -167,7 +160,6 @@ def test_client_request_preserves_explicit_verify_none(monkeypatch):
 
 
 def test_client_request_respects_runtime_session_verify_override(monkeypatch):
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     client = KamiwazaClient()
@@ -191,7 +183,6 @@ def test_client_request_custom_ca_beats_env_bundle(monkeypatch):
     injected into every request – even when REQUESTS_CA_BUNDLE is set – so
     that requests' merge_environment_settings cannot override it with the
     env bundle."""
-    _clear_base_env(monkeypatch)
     monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://env.example/api")
     monkeypatch.setenv("KAMIWAZA_VERIFY_SSL", "false")
     monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/certs/ca-certificates.crt")
@@ -1,534 +1,482 @@
 from __future__ import annotations
 
-import io
-
 import pytest
 
-from kamiwaza_sdk.client import KamiwazaClient
 from kamiwaza_sdk.services.context import ContextService
 
 pytestmark = pytest.mark.unit
 
+WORKROOM_ID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+WORKROOM_HEADERS = {"X-Workroom-ID": WORKROOM_ID}
+UPLOAD_PAYLOAD = b"hello"
 
-def test_client_exposes_context_service(monkeypatch):
-    monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://example.test/api")
-    client = KamiwazaClient()
-
-    assert isinstance(client.context, ContextService)
-    assert client.context is client.context
-
-
-def test_health_calls_context_health(dummy_client):
-    client = dummy_client({("get", "/context/health"): {"status": "healthy"}})
-    service = ContextService(client)
-
-    result = service.health()
-
-    assert result["status"] == "healthy"
-    assert client.calls[0] == ("get", "/context/health", {})
-
-
-def test_list_vectordbs_sets_optional_workroom_header(dummy_client):
-    client = dummy_client({("get", "/context/vectordbs"): []})
-    service = ContextService(client)
-
-    service.list_vectordbs(workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff")
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/vectordbs")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_get_vectordb_uses_workroom_query_and_header(dummy_client):
-    client = dummy_client({("get", "/context/vectordbs/vdb-1"): {"id": "vdb-1"}})
-    service = ContextService(client)
-
-    service.get_vectordb(
-        "vdb-1",
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/vectordbs/vdb-1")
-    assert kwargs["params"] == {"workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_create_vectordb_builds_payload(dummy_client):
-    client = dummy_client({("post", "/context/vectordbs"): {"id": "abc"}})
-    service = ContextService(client)
-
-    service.create_vectordb(name="vdb", engine="milvus")
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs")
-    assert kwargs["json"] == {"name": "vdb", "engine": "milvus", "replicas": 1}
-
-
-def test_query_vectors_global_uses_body_vectordb_id(dummy_client):
-    responses = {("post", "/context/vectordbs/query"): {"results": []}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.query_vectors_global(
-        vectordb_id="vdb-1",
-        collection_name="docs",
-        vectors=[[0.1, 0.2, 0.3]],
-        limit=3,
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs/query")
-    assert kwargs["json"] == {
-        "vectordb_id": "vdb-1",
-        "collection_name": "docs",
-        "vectors": [[0.1, 0.2, 0.3]],
-        "limit": 3,
-    }
-
-
-def test_insert_vectors_global_uses_body_vectordb_id(dummy_client):
-    responses = {("post", "/context/vectordbs/insert"): {"inserted_count": 1}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.insert_vectors_global(
-        vectordb_id="vdb-1",
-        collection_name="docs",
-        vectors=[[0.1, 0.2, 0.3]],
-        metadata=[{"id": "row-1"}],
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs/insert")
-    assert kwargs["json"] == {
-        "vectordb_id": "vdb-1",
-        "collection_name": "docs",
-        "vectors": [[0.1, 0.2, 0.3]],
-        "metadata": [{"id": "row-1"}],
-        "create_if_missing": True,
-    }
-
-
-def test_list_collections_sets_workroom_header(dummy_client):
-    responses = {("get", "/context/collections/"): []}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.list_collections(workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff")
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/collections/")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_update_vectordb_uses_put_with_workroom_query(dummy_client):
-    responses = {("put", "/context/vectordbs/vdb-1"): {"id": "vdb-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.update_vectordb(
-        "vdb-1",
-        config={"x": "1"},
-        replicas=2,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("put", "/context/vectordbs/vdb-1")
-    assert kwargs["params"] == {"workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
-    assert kwargs["json"] == {"config": {"x": "1"}, "replicas": 2}
-
-
-def test_scale_vectordb_posts_replicas_and_workroom_query(dummy_client):
-    responses = {("post", "/context/vectordbs/vdb-1/scale"): {"id": "vdb-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.scale_vectordb(
-        "vdb-1",
-        replicas=3,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs/vdb-1/scale")
-    assert kwargs["json"] == {"replicas": 3}
-    assert kwargs["params"] == {"workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_delete_vectordb_uses_delete_with_optional_workroom_query(dummy_client):
-    responses = {("delete", "/context/vectordbs/vdb-1"): {"message": "ok"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.delete_vectordb(
-        "vdb-1",
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("delete", "/context/vectordbs/vdb-1")
-    assert kwargs["params"] == {"workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_list_pipeline_jobs_applies_filters(dummy_client):
-    responses = {("get", "/context/pipelines/"): []}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.list_pipeline_jobs(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        status="running",
-        limit=10,
-        offset=5,
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/pipelines/")
-    assert kwargs["params"] == {"status": "running", "limit": 10, "offset": 5}
-
-
-def test_delete_ontology_calls_expected_path(dummy_client):
-    responses = {("delete", "/context/ontologies/o-1"): {"message": "ok"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.delete_ontology("o-1")
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("delete", "/context/ontologies/o-1")
-    assert kwargs["params"] is None
-
-
-def test_insert_vectors_payload_supports_optional_field_list(dummy_client):
-    responses = {("post", "/context/vectordbs/vdb-1/insert"): {"inserted_count": 1}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.insert_vectors(
-        "vdb-1",
-        collection_name="docs",
-        vectors=[[0.1, 0.2, 0.3]],
-        metadata=[{"id": "1"}],
-        field_list=[["id", "str"]],
-        create_if_missing=False,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs/vdb-1/insert")
-    assert kwargs["json"] == {
-        "collection_name": "docs",
-        "vectors": [[0.1, 0.2, 0.3]],
-        "metadata": [{"id": "1"}],
-        "field_list": [["id", "str"]],
-        "create_if_missing": False,
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_query_vectors_payload_includes_optional_params(dummy_client):
-    responses = {("post", "/context/vectordbs/vdb-1/query"): {"results": []}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.query_vectors(
-        "vdb-1",
-        collection_name="docs",
-        vectors=[[0.9, 0.8, 0.7]],
-        limit=5,
-        params={"metric_type": "L2"},
-        output_fields=["source"],
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/vectordbs/vdb-1/query")
-    assert kwargs["json"] == {
-        "collection_name": "docs",
-        "vectors": [[0.9, 0.8, 0.7]],
-        "limit": 5,
-        "params": {"metric_type": "L2"},
-        "output_fields": ["source"],
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_list_ontologies_sets_optional_workroom_header(dummy_client):
-    responses = {("get", "/context/ontologies"): []}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.list_ontologies(workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff")
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/ontologies")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_get_ontology_uses_optional_workroom_query(dummy_client):
-    responses = {("get", "/context/ontologies/o-1"): {"id": "o-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.get_ontology(
-        "o-1",
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/ontologies/o-1")
-    assert kwargs["params"] == {"workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_create_ontology_includes_optional_payload_fields(dummy_client):
-    responses = {("post", "/context/ontologies"): {"id": "o-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.create_ontology(
-        name="graph",
-        backend="graphiti",
-        config={"api_key": "abc"},
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/ontologies")
-    assert kwargs["json"] == {
-        "name": "graph",
-        "backend": "graphiti",
-        "config": {"api_key": "abc"},
-        "workroom_id": "ffffffff-ffff-ffff-ffff-ffffffffffff",
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_add_knowledge_posts_expected_payload(dummy_client):
-    responses = {
-        ("post", "/context/ontologies/o-1/knowledge"): {"group_id": "g1"}
-    }
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.add_knowledge(
-        "o-1",
-        group_id="g1",
-        messages=[{"role": "user", "content": "hello"}],
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/ontologies/o-1/knowledge")
-    assert kwargs["json"] == {
-        "group_id": "g1",
-        "messages": [{"role": "user", "content": "hello"}],
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_add_entity_posts_expected_payload(dummy_client):
-    responses = {("post", "/context/ontologies/o-1/entity"): {"success": True}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.add_entity(
-        "o-1",
-        group_id="g1",
-        name="Entity One",
-        entity_type="concept",
-        summary="summary",
-        properties={"priority": "high"},
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/ontologies/o-1/entity")
-    assert kwargs["json"] == {
-        "group_id": "g1",
-        "name": "Entity One",
-        "entity_type": "concept",
-        "summary": "summary",
-        "properties": {"priority": "high"},
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_search_knowledge_posts_expected_payload(dummy_client):
-    responses = {("post", "/context/ontologies/o-1/search"): {"facts": []}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.search_knowledge(
-        "o-1",
-        query="where is file",
-        group_ids=["g1", "g2"],
-        max_results=7,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/ontologies/o-1/search")
-    assert kwargs["json"] == {
-        "query": "where is file",
-        "group_ids": ["g1", "g2"],
-        "max_results": 7,
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_get_memory_posts_expected_payload(dummy_client):
-    responses = {("post", "/context/ontologies/o-1/memory"): {"facts": []}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.get_memory(
-        "o-1",
-        group_id="g1",
-        query="what happened",
-        max_facts=4,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/ontologies/o-1/memory")
-    assert kwargs["json"] == {"group_id": "g1", "query": "what happened", "max_facts": 4}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_get_episodes_uses_last_n_query_param(dummy_client):
-    responses = {
-        ("get", "/context/ontologies/o-1/episodes/g1"): {"episodes": []}
-    }
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.get_episodes(
-        "o-1",
-        group_id="g1",
-        last_n=12,
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/ontologies/o-1/episodes/g1")
-    assert kwargs["params"] == {"last_n": 12}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_delete_group_calls_expected_path(dummy_client):
-    responses = {
-        ("delete", "/context/ontologies/o-1/groups/g1"): {"deleted": True}
-    }
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.delete_group(
-        "o-1",
-        group_id="g1",
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
 
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("delete", "/context/ontologies/o-1/groups/g1")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
+@pytest.fixture
+def context_service(dummy_client):
+    """Build a ``ContextService`` over a fresh dummy client; returns both."""
 
+    def _factory(responses):
+        client = dummy_client(responses)
+        return ContextService(client), client
 
-def test_ontology_health_calls_expected_path(dummy_client):
-    responses = {("get", "/context/ontologies/o-1/health"): {"healthy": True}}
-    client = dummy_client(responses)
-    service = ContextService(client)
+    return _factory
 
-    service.ontology_health(
-        "o-1",
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-    )
 
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/ontologies/o-1/health")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
+def test_client_exposes_context_service(env_client):
+    context = env_client.context
 
+    assert isinstance(context, ContextService)
+    assert context is env_client.context, "service should be memoized on the client"
 
-def test_create_collection_posts_expected_payload(dummy_client):
-    responses = {("post", "/context/collections/"): {"display_name": "docs"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
 
-    service.create_collection(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        name="docs",
-        dimension=768,
-        description="documents",
-    )
+def test_health_calls_context_health(context_service):
+    service, client = context_service({("get", "/context/health"): {"status": "healthy"}})
 
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/collections/")
-    assert kwargs["json"] == {
-        "name": "docs",
-        "dimension": 768,
-        "description": "documents",
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_get_collection_calls_expected_path(dummy_client):
-    responses = {("get", "/context/collections/docs"): {"display_name": "docs"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.get_collection(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        collection_name="docs",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/collections/docs")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_delete_collection_calls_expected_path(dummy_client):
-    responses = {("delete", "/context/collections/docs"): None}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.delete_collection(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        collection_name="docs",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("delete", "/context/collections/docs")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_create_pipeline_job_posts_expected_payload(dummy_client):
-    responses = {("post", "/context/pipelines/"): {"id": "job-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.create_pipeline_job(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        files=[{"filename": "a.txt", "content_base64": "aGVsbG8="}],
-        config={"collection_name": "docs"},
-    )
+    result = service.health()
 
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/pipelines/")
-    assert kwargs["json"] == {
-        "files": [{"filename": "a.txt", "content_base64": "aGVsbG8="}],
-        "config": {"collection_name": "docs"},
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
+    assert result["status"] == "healthy"
+    assert client.calls[0] == ("get", "/context/health", {})
 
 
-def test_get_supported_file_types_calls_expected_path(dummy_client):
-    responses = {("get", "/context/pipelines/supported-types"): [".txt"]}
-    client = dummy_client(responses)
-    service = ContextService(client)
+@pytest.mark.parametrize(
+    ("operation", "kwargs", "method", "path", "expected"),
+    [
+        # VectorDBs
+        pytest.param(
+            "list_vectordbs",
+            {"workroom_id": WORKROOM_ID},
+            "get",
+            "/context/vectordbs",
+            {"headers": WORKROOM_HEADERS},
+            id="list_vectordbs",
+        ),
+        pytest.param(
+            "get_vectordb",
+            {"vectordb_id": "vdb-1", "workroom_id": WORKROOM_ID},
+            "get",
+            "/context/vectordbs/vdb-1",
+            {"params": {"workroom_id": WORKROOM_ID}, "headers": WORKROOM_HEADERS},
+            id="get_vectordb",
+        ),
+        pytest.param(
+            "create_vectordb",
+            {"name": "vdb", "engine": "milvus"},
+            "post",
+            "/context/vectordbs",
+            {"json": {"name": "vdb", "engine": "milvus", "replicas": 1}},
+            id="create_vectordb",
+        ),
+        pytest.param(
+            "update_vectordb",
+            {"vectordb_id": "vdb-1", "config": {"x": "1"}, "replicas": 2, "workroom_id": WORKROOM_ID},
+            "put",
+            "/context/vectordbs/vdb-1",
+            {"params": {"workroom_id": WORKROOM_ID}, "json": {"config": {"x": "1"}, "replicas": 2}},
+            id="update_vectordb",
+        ),
+        pytest.param(
+            "scale_vectordb",
+            {"vectordb_id": "vdb-1", "replicas": 3, "workroom_id": WORKROOM_ID},
+            "post",
+            "/context/vectordbs/vdb-1/scale",
+            {
+                "json": {"replicas": 3},
+                "params": {"workroom_id": WORKROOM_ID},
+                "headers": WORKROOM_HEADERS,
+            },
+            id="scale_vectordb",
+        ),
+        pytest.param(
+            "delete_vectordb",
+            {"vectordb_id": "vdb-1", "workroom_id": WORKROOM_ID},
+            "delete",
+            "/context/vectordbs/vdb-1",
+            {"params": {"workroom_id": WORKROOM_ID}, "headers": WORKROOM_HEADERS},
+            id="delete_vectordb",
+        ),
+        pytest.param(
+            "query_vectors_global",
+            {
+                "vectordb_id": "vdb-1",
+                "collection_name": "docs",
+                "vectors": [[0.1, 0.2, 0.3]],
+                "limit": 3,
+            },
+            "post",
+            "/context/vectordbs/query",
+            {
+                "json": {
+                    "vectordb_id": "vdb-1",
+                    "collection_name": "docs",
+                    "vectors": [[0.1, 0.2, 0.3]],
+                    "limit": 3,
+                }
+            },
+            id="query_vectors_global",
+        ),
+        pytest.param(
+            "insert_vectors_global",
+            {
+                "vectordb_id": "vdb-1",
+                "collection_name": "docs",
+                "vectors": [[0.1, 0.2, 0.3]],
+                "metadata": [{"id": "row-1"}],
+            },
+            "post",
+            "/context/vectordbs/insert",
+            {
+                "json": {
+                    "vectordb_id": "vdb-1",
+                    "collection_name": "docs",
+                    "vectors": [[0.1, 0.2, 0.3]],
+                    "metadata": [{"id": "row-1"}],
+                    "create_if_missing": True,
+                }
+            },
+            id="insert_vectors_global",
+        ),
+        pytest.param(
+            "insert_vectors",
+            {
+                "vectordb_id": "vdb-1",
+                "collection_name": "docs",
+                "vectors": [[0.1, 0.2, 0.3]],
+                "metadata": [{"id": "1"}],
+                "field_list": [["id", "str"]],
+                "create_if_missing": False,
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/vectordbs/vdb-1/insert",
+            {
+                "json": {
+                    "collection_name": "docs",
+                    "vectors": [[0.1, 0.2, 0.3]],
+                    "metadata": [{"id": "1"}],
+                    "field_list": [["id", "str"]],
+                    "create_if_missing": False,
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="insert_vectors",
+        ),
+        pytest.param(
+            "query_vectors",
+            {
+                "vectordb_id": "vdb-1",
+                "collection_name": "docs",
+                "vectors": [[0.9, 0.8, 0.7]],
+                "limit": 5,
+                "params": {"metric_type": "L2"},
+                "output_fields": ["source"],
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/vectordbs/vdb-1/query",
+            {
+                "json": {
+                    "collection_name": "docs",
+                    "vectors": [[0.9, 0.8, 0.7]],
+                    "limit": 5,
+                    "params": {"metric_type": "L2"},
+                    "output_fields": ["source"],
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="query_vectors",
+        ),
+        # Ontologies
+        pytest.param(
+            "list_ontologies",
+            {"workroom_id": WORKROOM_ID},
+            "get",
+            "/context/ontologies",
+            {"headers": WORKROOM_HEADERS},
+            id="list_ontologies",
+        ),
+        pytest.param(
+            "get_ontology",
+            {"ontology_id": "o-1", "workroom_id": WORKROOM_ID},
+            "get",
+            "/context/ontologies/o-1",
+            {"params": {"workroom_id": WORKROOM_ID}, "headers": WORKROOM_HEADERS},
+            id="get_ontology",
+        ),
+        pytest.param(
+            "create_ontology",
+            {
+                "name": "graph",
+                "backend": "graphiti",
+                "config": {"api_key": "abc"},
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/ontologies",
+            {
+                "json": {
+                    "name": "graph",
+                    "backend": "graphiti",
+                    "config": {"api_key": "abc"},
+                    "workroom_id": WORKROOM_ID,
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="create_ontology",
+        ),
+        pytest.param(
+            "delete_ontology",
+            {"ontology_id": "o-1"},
+            "delete",
+            "/context/ontologies/o-1",
+            {"params": None},
+            id="delete_ontology",
+        ),
+        pytest.param(
+            "add_knowledge",
+            {
+                "ontology_id": "o-1",
+                "group_id": "g1",
+                "messages": [{"role": "user", "content": "hello"}],
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/ontologies/o-1/knowledge",
+            {
+                "json": {"group_id": "g1", "messages": [{"role": "user", "content": "hello"}]},
+                "headers": WORKROOM_HEADERS,
+            },
+            id="add_knowledge",
+        ),
+        pytest.param(
+            "add_entity",
+            {
+                "ontology_id": "o-1",
+                "group_id": "g1",
+                "name": "Entity One",
+                "entity_type": "concept",
+                "summary": "summary",
+                "properties": {"priority": "high"},
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/ontologies/o-1/entity",
+            {
+                "json": {
+                    "group_id": "g1",
+                    "name": "Entity One",
+                    "entity_type": "concept",
+                    "summary": "summary",
+                    "properties": {"priority": "high"},
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="add_entity",
+        ),
+        pytest.param(
+            "search_knowledge",
+            {
+                "ontology_id": "o-1",
+                "query": "where is file",
+                "group_ids": ["g1", "g2"],
+                "max_results": 7,
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/ontologies/o-1/search",
+            {
+                "json": {"query": "where is file", "group_ids": ["g1", "g2"], "max_results": 7},
+                "headers": WORKROOM_HEADERS,
+            },
+            id="search_knowledge",
+        ),
+        pytest.param(
+            "get_memory",
+            {
+                "ontology_id": "o-1",
+                "group_id": "g1",
+                "query": "what happened",
+                "max_facts": 4,
+                "workroom_id": WORKROOM_ID,
+            },
+            "post",
+            "/context/ontologies/o-1/memory",
+            {
+                "json": {"group_id": "g1", "query": "what happened", "max_facts": 4},
+                "headers": WORKROOM_HEADERS,
+            },
+            id="get_memory",
+        ),
+        pytest.param(
+            "get_episodes",
+            {"ontology_id": "o-1", "group_id": "g1", "last_n": 12, "workroom_id": WORKROOM_ID},
+            "get",
+            "/context/ontologies/o-1/episodes/g1",
+            {"params": {"last_n": 12}, "headers": WORKROOM_HEADERS},
+            id="get_episodes",
+        ),
+        pytest.param(
+            "delete_group",
+            {"ontology_id": "o-1", "group_id": "g1", "workroom_id": WORKROOM_ID},
+            "delete",
+            "/context/ontologies/o-1/groups/g1",
+            {"headers": WORKROOM_HEADERS},
+            id="delete_group",
+        ),
+        pytest.param(
+            "ontology_health",
+            {"ontology_id": "o-1", "workroom_id": WORKROOM_ID},
+            "get",
+            "/context/ontologies/o-1/health",
+            {"headers": WORKROOM_HEADERS},
+            id="ontology_health",
+        ),
+        # Collections
+        pytest.param(
+            "list_collections",
+            {"workroom_id": WORKROOM_ID},
+            "get",
+            "/context/collections/",
+            {"headers": WORKROOM_HEADERS},
+            id="list_collections",
+        ),
+        pytest.param(
+            "create_collection",
+            {
+                "workroom_id": WORKROOM_ID,
+                "name": "docs",
+                "dimension": 768,
+                "description": "documents",
+            },
+            "post",
+            "/context/collections/",
+            {
+                "json": {"name": "docs", "dimension": 768, "description": "documents"},
+                "headers": WORKROOM_HEADERS,
+            },
+            id="create_collection",
+        ),
+        pytest.param(
+            "get_collection",
+            {"workroom_id": WORKROOM_ID, "collection_name": "docs"},
+            "get",
+            "/context/collections/docs",
+            {"headers": WORKROOM_HEADERS},
+            id="get_collection",
+        ),
+        pytest.param(
+            "delete_collection",
+            {"workroom_id": WORKROOM_ID, "collection_name": "docs"},
+            "delete",
+            "/context/collections/docs",
+            {"headers": WORKROOM_HEADERS},
+            id="delete_collection",
+        ),
+        # Pipelines
+        pytest.param(
+            "create_pipeline_job",
+            {
+                "workroom_id": WORKROOM_ID,
+                "files": [{"filename": "a.txt", "content_base64": "aGVsbG8="}],
+                "config": {"collection_name": "docs"},
+            },
+            "post",
+            "/context/pipelines/",
+            {
+                "json": {
+                    "files": [{"filename": "a.txt", "content_base64": "aGVsbG8="}],
+                    "config": {"collection_name": "docs"},
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="create_pipeline_job",
+        ),
+        pytest.param(
+            "list_pipeline_jobs",
+            {"workroom_id": WORKROOM_ID, "status": "running", "limit": 10, "offset": 5},
+            "get",
+            "/context/pipelines/",
+            {"params": {"status": "running", "limit": 10, "offset": 5}},
+            id="list_pipeline_jobs",
+        ),
+        pytest.param(
+            "get_pipeline_job",
+            {"workroom_id": WORKROOM_ID, "job_id": "job-1"},
+            "get",
+            "/context/pipelines/job-1",
+            {"headers": WORKROOM_HEADERS},
+            id="get_pipeline_job",
+        ),
+        pytest.param(
+            "cancel_pipeline_job",
+            {"workroom_id": WORKROOM_ID, "job_id": "job-1"},
+            "delete",
+            "/context/pipelines/job-1",
+            {"headers": WORKROOM_HEADERS},
+            id="cancel_pipeline_job",
+        ),
+        # Search / retrieval
+        pytest.param(
+            "search",
+            {
+                "workroom_id": WORKROOM_ID,
+                "query": "find docs",
+                "collection_name": "docs",
+                "top_k": 9,
+                "score_threshold": 0.65,
+            },
+            "post",
+            "/context/search",
+            {
+                "json": {
+                    "query": "find docs",
+                    "top_k": 9,
+                    "collection_name": "docs",
+                    "score_threshold": 0.65,
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="search",
+        ),
+        pytest.param(
+            "retrieve",
+            {
+                "workroom_id": WORKROOM_ID,
+                "query": "q",
+                "collection_names": ["c1", "c2"],
+                "top_k": 3,
+                "score_threshold": 0.4,
+            },
+            "post",
+            "/context/retrieve",
+            {
+                "json": {
+                    "query": "q",
+                    "top_k": 3,
+                    "score_threshold": 0.4,
+                    "collection_names": ["c1", "c2"],
+                },
+                "headers": WORKROOM_HEADERS,
+            },
+            id="retrieve",
+        ),
+    ],
+)
+def test_operation_sends_expected_request(
+    context_service, operation, kwargs, method, path, expected
+):
+    service, client = context_service({(method, path): {}})
+
+    getattr(service, operation)(**kwargs)
+
+    assert len(client.calls) == 1
+    called_method, called_path, called_kwargs = client.calls[0]
+    assert (called_method, called_path) == (method, path)
+    # Only the request parts each row names are checked.
+    assert {key: called_kwargs[key] for key in expected} == expected
+
+
+def test_get_supported_file_types_calls_expected_path(context_service):
+    service, client = context_service({("get", "/context/pipelines/supported-types"): [".txt"]})
 
     result = service.get_supported_file_types()
 
@@ -538,70 +486,13 @@ def test_get_supported_file_types_calls_expected_path(dummy_client):
     assert ".txt" in result
 
 
-def test_get_pipeline_job_calls_expected_path(dummy_client):
-    responses = {("get", "/context/pipelines/job-1"): {"id": "job-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.get_pipeline_job(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        job_id="job-1",
-    )
+def test_upload_file_sends_files_and_optional_params(context_service):
+    service, client = context_service({("post", "/context/upload/"): {"id": "job-1"}})
 
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("get", "/context/pipelines/job-1")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_cancel_pipeline_job_calls_expected_path(dummy_client):
-    responses = {("delete", "/context/pipelines/job-1"): None}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.cancel_pipeline_job(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        job_id="job-1",
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("delete", "/context/pipelines/job-1")
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_search_builds_payload_with_optional_fields(dummy_client):
-    responses = {("post", "/context/search"): {"results": []}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.search(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        query="find docs",
-        collection_name="docs",
-        top_k=9,
-        score_threshold=0.65,
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/search")
-    assert kwargs["json"] == {
-        "query": "find docs",
-        "top_k": 9,
-        "collection_name": "docs",
-        "score_threshold": 0.65,
-    }
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
-
-
-def test_upload_file_sends_files_and_optional_params(dummy_client):
-    responses = {("post", "/context/upload/"): {"id": "job-1"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    payload = io.BytesIO(b"hello")
     service.upload_file(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
+        workroom_id=WORKROOM_ID,
         filename="sample.txt",
-        file_content=payload,
+        file_content=UPLOAD_PAYLOAD,
         content_type="text/plain",
         collection_name="docs",
         source_urn="urn:test:sample",
@@ -610,28 +501,6 @@ def test_upload_file_sends_files_and_optional_params(dummy_client):
     method, path, kwargs = client.calls[0]
     assert (method, path) == ("post", "/context/upload/")
     assert kwargs["params"] == {"collection_name": "docs", "source_urn": "urn:test:sample"}
-    assert kwargs["headers"]["X-Workroom-ID"] == "ffffffff-ffff-ffff-ffff-ffffffffffff"
+    assert kwargs["headers"] == WORKROOM_HEADERS
     file_info = kwargs["files"]["file"]
-    assert file_info[0] == "sample.txt"
-    assert file_info[2] == "text/plain"
-
-
-def test_retrieve_builds_payload(dummy_client):
-    responses = {("post", "/context/retrieve"): {"query": "q"}}
-    client = dummy_client(responses)
-    service = ContextService(client)
-
-    service.retrieve(
-        workroom_id="ffffffff-ffff-ffff-ffff-ffffffffffff",
-        query="q",
-        collection_names=["c1", "c2"],
-        top_k=3,
-        score_threshold=0.4,
-    )
-
-    method, path, kwargs = client.calls[0]
-    assert (method, path) == ("post", "/context/retrieve")
-    assert kwargs["json"]["query"] == "q"
-    assert kwargs["json"]["collection_names"] == ["c1", "c2"]
-    assert kwargs["json"]["top_k"] == 3
-    assert kwargs["json"]["score_threshold"] == 0.4
+    assert file_info == ("sample.txt", UPLOAD_PAYLOAD, "text/plain")
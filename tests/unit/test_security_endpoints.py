@@ -0,0 +1,63 @@
+"""Recorded counterparts of ``tests/integration/test_security_live.py``.
+
+The security endpoints are public and their payloads are schema-static, so
+replaying recorded responses through a real ``KamiwazaClient`` covers the SDK
+plumbing without a running Kamiwaza server.
+"""
+
+from __future__ import annotations
+
+import pytest
+import responses
+
+from kamiwaza_sdk.client import KamiwazaClient
+
+pytestmark = pytest.mark.contract
+
+BASE_URL = "https://kamiwaza.test/api"
+
+
+@pytest.fixture
+def client() -> KamiwazaClient:
+    return KamiwazaClient(BASE_URL, api_key="test-key")
+
+
+def test_get_public_config(client: KamiwazaClient) -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/security/public/config",
+        json={"consent_enabled": False, "banner_enabled": False},
+    )
+
+    response = client.get("/security/public/config")
+
+    assert isinstance(response, dict)
+    assert "consent_enabled" in response or "banner_enabled" in response
+
+
+def test_get_embed_script(client: KamiwazaClient) -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/security/embed.js",
+        body="(function () {})();",
+        content_type="application/javascript",
+    )
+
+    response = client.get("/security/embed.js", expect_json=False)
+
+    assert response.status_code == 200
+    assert "javascript" in response.headers.get("content-type", "").lower()
+    assert len(response.text) > 0
+
+
+def test_accept_consent(client: KamiwazaClient) -> None:
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/security/consent/accept",
+        json={"accepted": True, "message": "Consent recorded"},
+    )
+
+    response = client.post("/security/consent/accept")
+
+    assert isinstance(response, dict)
+    assert response.get("accepted") is True
@@ -0,0 +1,47 @@
+"""Recorded negative-path checks mirrored from ``test_serving_endpoints_live.py``.
+
+The live suite only exercises the "nonexistent UUID" branches when the server
+has no deployments or instances. These replay the recorded 404 responses
+through a real ``KamiwazaClient`` so the error mapping stays covered without a
+running Kamiwaza server.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+import responses
+
+from kamiwaza_sdk.client import KamiwazaClient
+from kamiwaza_sdk.exceptions import APIError
+
+pytestmark = pytest.mark.contract
+
+BASE_URL = "https://kamiwaza.test/api"
+# Fixed so parametrize ids match across xdist workers.
+MISSING_ID = UUID("00000000-0000-4000-8000-000000000404")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        f"/serving/deployment/{MISSING_ID}/status",
+        f"/serving/deployment/{MISSING_ID}/logs/patterns",
+        f"/serving/model_instance/{MISSING_ID}",
+    ],
+)
+def test_missing_serving_resource_raises_404(path: str) -> None:
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}{path}",
+        json={"detail": "Not Found"},
+        status=404,
+    )
+    client = KamiwazaClient(BASE_URL, api_key="test-key")
+
+    with pytest.raises(APIError) as exc_info:
+        client.get(path)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.response_data == {"detail": "Not Found"}
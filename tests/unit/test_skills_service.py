@@ -6,7 +6,6 @@ from uuid import uuid4
 import pytest
 from pydantic import ValidationError
 
-from kamiwaza_sdk.client import KamiwazaClient
 from kamiwaza_sdk.exceptions import APIError, NotFoundError
 from kamiwaza_sdk.schemas.skills import (
     SkillLibraryDetailResponse,
@@ -112,12 +111,11 @@ def _download_response(
     )
 
 
-def test_client_exposes_skills_service(monkeypatch):
-    monkeypatch.setenv("KAMIWAZA_BASE_URL", "https://example.test/api")
-    client = KamiwazaClient()
+def test_client_exposes_skills_service(env_client):
+    skills = env_client.skills
 
-    assert isinstance(client.skills, SkillsService)
-    assert client.skills is client.skills
+    assert isinstance(skills, SkillsService)
+    assert skills is env_client.skills, "service should be memoized on the client"
 
 
 def test_list_skills_builds_expected_query_params(dummy_client):
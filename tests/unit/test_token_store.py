@@ -8,16 +8,18 @@ from kamiwaza_sdk.token_store import FileTokenStore, StoredToken
 
 pytestmark = pytest.mark.unit
 
+_CACHED_TOKEN_EXPIRY = time.time() + 3600
+
 
 def test_file_token_store_round_trip(tmp_path):
     store = FileTokenStore(tmp_path / "token.json")
-    token = StoredToken(access_token="abc", refresh_token="ref", expires_at=time.time() + 60)
+    token = StoredToken(access_token="abc", refresh_token="ref", expires_at=_CACHED_TOKEN_EXPIRY)
 
     store.save(token)
     loaded = store.load()
 
     assert loaded == token
-    assert loaded and not loaded.is_expired
+    assert loaded and not loaded.is_expired()
 
 
 def test_file_token_store_handles_missing(tmp_path):